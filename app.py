@@ -29,22 +29,30 @@ from audiobook_backend import cli as _cli
 from audiobook_backend import epub_parser as _epub_parser
 from audiobook_backend import job as _job
 from audiobook_backend import pipeline as _pipeline
-from audiobook_backend.chunking import _clean_text, _clean_text_with_paragraphs, split_text_to_chunks
+from audiobook_backend.chunking import (
+    _clean_text,
+    _clean_text_with_paragraphs,
+    split_text_to_chunks,
+)
+from audiobook_backend.epub_parser import EpubSource
 from audiobook_backend.cleanup import (
     cleanup_backend as _cleanup_backend,
     cleanup_ffmpeg_process as _cleanup_ffmpeg_process,
     cleanup_spool_path as _cleanup_spool_path,
 )
 from audiobook_backend.cli import MainDeps, parse_args
-from audiobook_backend.events import EventEmitter, start_heartbeat_emitter
+from audiobook_backend.events import EventEmitter, format_text_event, start_heartbeat_emitter
 from audiobook_backend.export import (
     DEFAULT_SAMPLE_RATE,
     _escape_ffmetadata,
     audio_to_int16,
     audio_to_segment,
     close_mp3_export_stream,
+    concat_and_convert_to_int16,
     export_pcm_file_to_m4b,
     export_pcm_file_to_mp3,
+    export_pcm_file_to_wav,
+    export_pcm_file_with_soundfile,
     export_pcm_to_m4b,
     export_pcm_to_mp3,
     generate_ffmetadata,
@@ -58,6 +66,7 @@ from audiobook_backend.models import (
     JobInspectionResult,
     ParsedEpub,
     ParsedSection,
+    SplitResult,
     TextChunk,
 )
 from audiobook_backend.runtime import (
@@ -178,17 +187,17 @@ def parse_loaded_epub(book, progress_callback=None) -> ParsedEpub:
     return _epub_parser.parse_loaded_epub(book, progress_callback=progress_callback)
 
 
-def parse_epub(epub_path: str, progress_callback=None) -> ParsedEpub:
+def parse_epub(epub_path: EpubSource, progress_callback=None) -> ParsedEpub:
     _sync_epub_module()
     return _epub_parser.parse_epub(epub_path, progress_callback=progress_callback)
 
 
-def extract_epub_metadata(epub_path: str) -> BookMetadata:
+def extract_epub_metadata(epub_path: EpubSource) -> BookMetadata:
     _sync_epub_module()
     return _epub_parser.extract_epub_metadata(epub_path)
 
 
-def extract_epub_text(epub_path: str):
+def extract_epub_text(epub_path: EpubSource):
     _sync_epub_module()
     return _epub_parser.extract_epub_text(epub_path)
 
@@ -251,6 +260,8 @@ def _build_main_deps() -> MainDeps:
         close_mp3_export_stream=close_mp3_export_stream,
         export_pcm_file_to_mp3=export_pcm_file_to_mp3,
         export_pcm_file_to_m4b=export_pcm_file_to_m4b,
+        export_pcm_file_to_wav=export_pcm_file_to_wav,
+        export_pcm_file_with_soundfile=export_pcm_file_with_soundfile,
         run_sequential_pipeline=_run_sequential_pipeline,
         run_overlap3_pipeline=_run_overlap3_pipeline,
         cleanup_backend=_cleanup_backend,
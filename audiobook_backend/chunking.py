@@ -1,92 +1,181 @@
 import re
-from typing import List, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Iterator, List, Tuple, Union
 
-from .models import ParsedSection, TextChunk
+from .models import ParsedSection, SplitResult, TextChunk
+
+PARAGRAPH_SPLIT_RE = re.compile(r"\n+")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+BLANK_LINE_SPLIT_RE = re.compile(r"\n\s*\n+")
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
 
 
 def _clean_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    # str.split() drops the same Unicode whitespace runs as re's \s+ and strips
+    # the ends, without going through the regex engine.
+    return " ".join(text.split())
 
 
 def _clean_text_with_paragraphs(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     paragraphs = []
 
-    for raw_paragraph in re.split(r"\n\s*\n+", text):
-        paragraph = re.sub(r"\s+", " ", raw_paragraph).strip()
+    for raw_paragraph in BLANK_LINE_SPLIT_RE.split(text):
+        paragraph = _clean_text(raw_paragraph)
         if paragraph:
             paragraphs.append(paragraph)
 
     return "\n\n".join(paragraphs)
 
 
-def split_text_to_chunks(
-    chapters: List[Tuple[str, str] | ParsedSection], chunk_chars: int
-) -> Tuple[List[TextChunk], List[Tuple[int, str]]]:
-    """Split chapters into text chunks and track chapter boundaries."""
-    chunks: List[TextChunk] = []
-    chapter_start_indices: List[Tuple[int, str]] = []
-
-    def split_oversized_paragraph(paragraph: str) -> List[str]:
-        if len(paragraph) <= chunk_chars:
-            return [paragraph]
-
-        pieces: List[str] = []
-        sentences = re.split(r"(?<=[.!?])\s+", paragraph)
-        sentence_buffer = ""
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            if len(sentence) > chunk_chars:
-                if sentence_buffer:
-                    pieces.append(sentence_buffer)
-                    sentence_buffer = ""
-                for start in range(0, len(sentence), chunk_chars):
-                    pieces.append(sentence[start:start + chunk_chars])
-                continue
-
-            candidate = f"{sentence_buffer} {sentence}".strip()
-            if len(candidate) <= chunk_chars:
-                sentence_buffer = candidate
-            else:
-                if sentence_buffer:
-                    pieces.append(sentence_buffer)
-                sentence_buffer = sentence
-
-        if sentence_buffer:
-            pieces.append(sentence_buffer)
-
-        return pieces if pieces else [paragraph]
-
-    for chapter in chapters:
-        if isinstance(chapter, ParsedSection):
-            title = chapter.title
-            text = chapter.text
-        else:
-            title, text = chapter
-
-        paragraphs = [p.strip() for p in re.split(r"\n+", text) if p.strip()]
-        if not paragraphs:
+def _paragraph_splitter(
+    split_pattern: Union[str, "re.Pattern[str]"],
+) -> Callable[[str], List[str]]:
+    """Return the cheapest callable that splits text like ``split_pattern``.
+
+    Callers drop blank pieces, so ``\\n+`` is equivalent to splitting on every
+    newline, and a pattern without regex metacharacters is a plain substring;
+    both are served by ``str.split`` instead of the regex engine.
+    """
+    if isinstance(split_pattern, str):
+        pattern = split_pattern
+    elif split_pattern.flags == re.UNICODE:
+        pattern = split_pattern.pattern
+    else:
+        return split_pattern.split
+
+    if pattern == r"\n+":
+        return lambda text: text.split("\n")
+    if pattern and not _REGEX_METACHARS.intersection(pattern):
+        return lambda text: text.split(pattern)
+    return re.compile(split_pattern).split
+
+
+def _pack_sentences(sentences: List[str], chunk_chars: int) -> List[str]:
+    """Greedily pack sentences, each at most ``chunk_chars``, into space-joined pieces.
+
+    Piece boundaries are found by bisecting the running joined length instead
+    of re-measuring a growing buffer sentence by sentence.
+    """
+    # ends[i] is the joined length of sentences[:i + 1] plus one trailing space.
+    ends = list(accumulate(len(sentence) + 1 for sentence in sentences))
+    pieces: List[str] = []
+    start = 0
+    while start < len(sentences):
+        base = ends[start - 1] if start else 0
+        stop = bisect_right(ends, base + chunk_chars + 1, lo=start)
+        pieces.append(" ".join(sentences[start:stop]))
+        start = stop
+    return pieces
+
+
+def _split_oversize(text: str, chunk_chars: int) -> List[str]:
+    """Split a paragraph longer than ``chunk_chars`` at sentence boundaries.
+
+    Sentences that still exceed the limit are hard-split into fixed-width
+    slices.
+    """
+    pieces: List[str] = []
+    run: List[str] = []
+
+    for raw_sentence in SENTENCE_SPLIT_RE.split(text):
+        sentence = raw_sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= chunk_chars:
+            run.append(sentence)
             continue
 
-        chapter_start_indices.append((len(chunks), title))
+        if run:
+            pieces.extend(_pack_sentences(run, chunk_chars))
+            run = []
+        for start in range(0, len(sentence), chunk_chars):
+            piece = sentence[start:start + chunk_chars].strip()
+            if piece:
+                pieces.append(piece)
+
+    if run:
+        pieces.extend(_pack_sentences(run, chunk_chars))
+
+    return pieces if pieces else [text]
+
+
+def _chapter_title_and_text(chapter: Tuple[str, str] | ParsedSection) -> Tuple[str, str]:
+    if isinstance(chapter, ParsedSection):
+        return chapter.title, chapter.text
+    return chapter
+
+
+def _iter_chapter_chunks(
+    title: str,
+    text: str,
+    chunk_chars: int,
+    split_paragraphs: Callable[[str], List[str]],
+) -> Iterator[TextChunk]:
+    # isspace() scans in C and exits early, without the copy strip() makes.
+    if not text or text.isspace():
+        return
+
+    # Splitting "\n\n"-separated text on "\n" yields an empty piece between
+    # every paragraph; the truthiness check drops those before strip().
+    paragraphs = (
+        stripped for p in split_paragraphs(text) if p and (stripped := p.strip())
+    )
+
+    # Accumulate fragments and join once per chunk; growing a string with
+    # repeated concatenation is quadratic in the chunk length.
+    buffer: List[str] = []
+    buffer_len = 0
+    for paragraph in paragraphs:
+        pieces = (
+            [paragraph]
+            if len(paragraph) <= chunk_chars
+            else _split_oversize(paragraph, chunk_chars)
+        )
+        for piece in pieces:
+            added_len = len(piece) + (1 if buffer else 0)
+            if buffer and buffer_len + added_len <= chunk_chars:
+                buffer.append(piece)
+                buffer_len += added_len
+            else:
+                if buffer:
+                    yield TextChunk(title, " ".join(buffer))
+                buffer = [piece]
+                buffer_len = len(piece)
 
-        buffer = ""
-        for paragraph in paragraphs:
-            for piece in split_oversized_paragraph(paragraph):
-                if len(buffer) + len(piece) + 1 <= chunk_chars:
-                    buffer = f"{buffer} {piece}".strip()
-                else:
-                    if buffer:
-                        chunks.append(TextChunk(title, buffer))
-                    buffer = piece
+    if buffer:
+        yield TextChunk(title, " ".join(buffer))
 
-        if buffer:
-            chunks.append(TextChunk(title, buffer))
 
-    return chunks, chapter_start_indices
+def split_text_to_chunks(
+    chapters: List[Tuple[str, str] | ParsedSection],
+    chunk_chars: int,
+    split_pattern: Union[str, "re.Pattern[str]"] = PARAGRAPH_SPLIT_RE,
+) -> SplitResult:
+    """Split chapters into text chunks and track chapter boundaries.
+
+    Returns a ``SplitResult`` of ``(chunks, chapter_starts)``, where each
+    chapter start is the index of that chapter's first chunk, taken from a
+    running sum of the per-chapter chunk counts.
+
+    ``split_pattern`` separates paragraphs and may be a regex string or an
+    already compiled pattern; it is resolved once per call, not once per
+    chapter, and trivial patterns skip the regex engine entirely.
+    """
+    split_paragraphs = _paragraph_splitter(split_pattern)
+    per_chapter: List[Tuple[str, List[TextChunk]]] = []
 
+    for chapter in chapters:
+        title, text = _chapter_title_and_text(chapter)
+        chapter_chunks = list(_iter_chapter_chunks(title, text, chunk_chars, split_paragraphs))
+        if chapter_chunks:
+            per_chapter.append((title, chapter_chunks))
+
+    offsets = accumulate((len(chapter_chunks) for _, chapter_chunks in per_chapter), initial=0)
+    chapter_start_indices = [
+        (offset, title) for offset, (title, _) in zip(offsets, per_chapter)
+    ]
+    chunks = [chunk for _, chapter_chunks in per_chapter for chunk in chapter_chunks]
+
+    return SplitResult(chunks, chapter_start_indices)
@@ -38,6 +38,11 @@ def cleanup_ffmpeg_process(
                     proc.wait(timeout=5)
                 except subprocess.TimeoutExpired:
                     pass
+
+        # open_mp3_export_stream attaches ffmpeg's stderr log file here; on
+        # abort paths close_mp3_export_stream never runs to close it.
+        if proc.stderr is not None:
+            proc.stderr.close()
         return None
     except BaseException as exc:  # pragma: no cover - asserted via main() behavior
         return exc
@@ -1,10 +1,13 @@
 import argparse
+import functools
 import gc
 import os
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 from rich.progress import (
     BarColumn,
@@ -33,6 +36,8 @@ from .export import (
     close_mp3_export_stream,
     export_pcm_file_to_m4b,
     export_pcm_file_to_mp3,
+    export_pcm_file_to_wav,
+    export_pcm_file_with_soundfile,
     open_mp3_export_stream,
 )
 from .job import (
@@ -41,6 +46,7 @@ from .job import (
     PreparedJob,
     build_checkpoint_config,
     prepare_job,
+    resolve_backend_and_device,
 )
 from .models import ChapterInfo, JobInspectionResult
 from .pipeline import run_overlap3_pipeline, run_sequential_pipeline
@@ -65,6 +71,8 @@ class MainDeps:
     close_mp3_export_stream: Callable[[Any], None]
     export_pcm_file_to_mp3: Callable[..., None]
     export_pcm_file_to_m4b: Callable[..., None]
+    export_pcm_file_to_wav: Callable[..., None]
+    export_pcm_file_with_soundfile: Callable[..., None]
     run_sequential_pipeline: Callable[..., Any]
     run_overlap3_pipeline: Callable[..., Any]
     cleanup_backend: Callable[[Optional[TTSBackend]], Optional[BaseException]]
@@ -96,6 +104,8 @@ DEFAULT_MAIN_DEPS = MainDeps(
     close_mp3_export_stream=close_mp3_export_stream,
     export_pcm_file_to_mp3=export_pcm_file_to_mp3,
     export_pcm_file_to_m4b=export_pcm_file_to_m4b,
+    export_pcm_file_to_wav=export_pcm_file_to_wav,
+    export_pcm_file_with_soundfile=export_pcm_file_with_soundfile,
     run_sequential_pipeline=run_sequential_pipeline,
     run_overlap3_pipeline=run_overlap3_pipeline,
     cleanup_backend=cleanup_backend,
@@ -107,10 +117,11 @@ DEFAULT_MAIN_DEPS = MainDeps(
 )
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="EPUB to audiobook using Kokoro TTS")
     parser.add_argument("--input", required=True, help="Path to input EPUB")
-    parser.add_argument("--output", required=True, help="Path to output file (MP3 or M4B)")
+    parser.add_argument("--output", required=True, help="Path to output file (MP3, M4B, WAV, FLAC, or OGG)")
     parser.add_argument("--voice", default="af_heart", help="Kokoro voice")
     parser.add_argument("--lang_code", default="a", help="Kokoro language code")
     parser.add_argument("--speed", type=float, default=1.0, help="Speech speed")
@@ -168,9 +179,12 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--format",
-        choices=["mp3", "m4b"],
+        choices=["mp3", "m4b", "wav", "flac", "ogg"],
         default="mp3",
-        help="Output format: mp3 (default) or m4b (with chapters)",
+        help=(
+            "Output format: mp3 (default), m4b (with chapters), wav (uncompressed), "
+            "flac (lossless), or ogg (Vorbis)"
+        ),
     )
     parser.add_argument(
         "--bitrate",
@@ -235,7 +249,11 @@ def parse_args() -> argparse.Namespace:
         "--log_file",
         help="Optional path to append backend logs",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
 def inspect_job(
@@ -354,62 +372,6 @@ def main(deps: Optional[MainDeps] = None) -> None:
             return
 
         events.emit("phase", phase="PARSING")
-        parse_heartbeat_stop, parse_heartbeat_thread = deps.start_heartbeat_emitter(
-            events,
-            thread_name="parse-heartbeat",
-        )
-        try:
-            prepared = deps.prepare_job(
-                args,
-                inspect_checkpoint_state=True,
-                progress_callback=lambda current_item, total_items, chapter_count: (
-                    events.emit(
-                        "parse_progress",
-                        current_item=current_item,
-                        total_items=total_items,
-                        current_chapter_count=chapter_count,
-                    )
-                ),
-                deps=deps.preparation_deps,
-            )
-        finally:
-            parse_heartbeat_stop.set()
-            parse_heartbeat_thread.join(timeout=1)
-
-        events.emit("metadata", key="backend_resolved", value=prepared.resolved_backend)
-        events.emit("metadata", key="device_resolved", value=prepared.resolved_device)
-        events.emit("metadata", key="pipeline_mode", value=prepared.pipeline_mode)
-        for warning in prepared.warnings:
-            events.warn(warning)
-
-        events.emit("metadata", key="total_chars", value=prepared.total_chars)
-        events.emit(
-            "metadata",
-            key="chapter_count",
-            value=len(prepared.chapter_start_indices),
-        )
-
-        total_chunks = len(prepared.chunks)
-        completed_chunks: set[int] = set()
-        checkpoint_state = None
-
-        if use_checkpoint and args.resume:
-            config_for_verify = build_checkpoint_config(
-                args,
-                prepared.resolved_backend,
-                prepared.chunk_chars,
-                prepared.resolved_device,
-            )
-            if deps.verify_checkpoint(checkpoint_dir, args.input, config_for_verify):
-                state = deps.load_checkpoint(checkpoint_dir)
-                if state and state.total_chunks == total_chunks:
-                    completed_chunks = set(state.completed_chunks)
-                    checkpoint_state = state
-                    events.emit("checkpoint", code="RESUMING", detail=len(completed_chunks))
-                else:
-                    events.emit("checkpoint", code="INVALID", detail="chunk_mismatch")
-            else:
-                events.emit("checkpoint", code="INVALID", detail="config_mismatch")
 
         backend: Optional[TTSBackend] = None
         spool_path: Optional[str] = None
@@ -419,17 +381,99 @@ def main(deps: Optional[MainDeps] = None) -> None:
         main_error: Optional[BaseException] = None
 
         try:
+            # EPUB parsing and chunking run on a worker thread while the main
+            # thread loads the TTS model, so neither phase waits on the other.
+            backend_resolution = resolve_backend_and_device(args, deps.preparation_deps)
+            resolved_backend, resolved_device, _ = backend_resolution
+            # Set by the first parse progress report or when preparation ends.
+            # An unreadable archive fails before any progress is reported, so
+            # waiting on this surfaces input errors before the slow model load.
+            parse_started = threading.Event()
+
+            def report_parse_progress(current_item, total_items, chapter_count):
+                parse_started.set()
+                events.emit(
+                    "parse_progress",
+                    current_item=current_item,
+                    total_items=total_items,
+                    current_chapter_count=chapter_count,
+                )
+
+            parse_heartbeat_stop, parse_heartbeat_thread = deps.start_heartbeat_emitter(
+                events,
+                thread_name="parse-heartbeat",
+            )
             try:
-                backend = deps.create_backend(prepared.resolved_backend)
-                backend.initialize(
-                    lang_code=args.lang_code,
-                    device=prepared.resolved_device,
+                with ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="epub-parse",
+                ) as parse_executor:
+                    prepare_future = parse_executor.submit(
+                        deps.prepare_job,
+                        args,
+                        inspect_checkpoint_state=True,
+                        progress_callback=report_parse_progress,
+                        deps=deps.preparation_deps,
+                        backend_resolution=backend_resolution,
+                    )
+                    prepare_future.add_done_callback(lambda _: parse_started.set())
+                    parse_started.wait()
+                    if prepare_future.done():
+                        # Raises a parse failure here, before initialize().
+                        prepare_future.result()
+                    try:
+                        backend = deps.create_backend(resolved_backend)
+                        backend.initialize(
+                            lang_code=args.lang_code,
+                            device=resolved_device,
+                        )
+                        sample_rate = backend.sample_rate
+                    except ImportError as exc:
+                        # Input problems are more actionable than a missing
+                        # backend, so surface a parse failure first.
+                        prepare_future.result()
+                        raise RuntimeError(
+                            f"Failed to initialize '{resolved_backend}' backend: {exc}"
+                        ) from exc
+                    prepared = prepare_future.result()
+            finally:
+                parse_heartbeat_stop.set()
+                parse_heartbeat_thread.join(timeout=1)
+
+            events.emit("metadata", key="backend_resolved", value=prepared.resolved_backend)
+            events.emit("metadata", key="device_resolved", value=prepared.resolved_device)
+            events.emit("metadata", key="pipeline_mode", value=prepared.pipeline_mode)
+            for warning in prepared.warnings:
+                events.warn(warning)
+
+            events.emit("metadata", key="total_chars", value=prepared.total_chars)
+            events.emit(
+                "metadata",
+                key="chapter_count",
+                value=len(prepared.chapter_start_indices),
+            )
+
+            total_chunks = len(prepared.chunks)
+            completed_chunks: set[int] = set()
+            checkpoint_state = None
+
+            if use_checkpoint and args.resume:
+                config_for_verify = build_checkpoint_config(
+                    args,
+                    prepared.resolved_backend,
+                    prepared.chunk_chars,
+                    prepared.resolved_device,
                 )
-                sample_rate = backend.sample_rate
-            except ImportError as exc:
-                raise RuntimeError(
-                    f"Failed to initialize '{prepared.resolved_backend}' backend: {exc}"
-                ) from exc
+                if deps.verify_checkpoint(checkpoint_dir, args.input, config_for_verify):
+                    state = deps.load_checkpoint(checkpoint_dir)
+                    if state and state.total_chunks == total_chunks:
+                        completed_chunks = set(state.completed_chunks)
+                        checkpoint_state = state
+                        events.emit("checkpoint", code="RESUMING", detail=len(completed_chunks))
+                    else:
+                        events.emit("checkpoint", code="INVALID", detail="chunk_mismatch")
+                else:
+                    events.emit("checkpoint", code="INVALID", detail="config_mismatch")
 
             output_dir = os.path.dirname(os.path.abspath(args.output))
             if output_dir and not os.path.exists(output_dir):
@@ -607,6 +651,25 @@ def main(deps: Optional[MainDeps] = None) -> None:
                     bitrate=args.bitrate,
                     normalize=args.normalize,
                 )
+            elif args.format == "wav":
+                if spool_path is None:
+                    raise RuntimeError("WAV export requires a spool path.")
+                deps.export_pcm_file_to_wav(
+                    spool_path,
+                    args.output,
+                    sample_rate=sample_rate,
+                    normalize=args.normalize,
+                )
+            elif args.format in ("flac", "ogg"):
+                if spool_path is None:
+                    raise RuntimeError(f"{args.format.upper()} export requires a spool path.")
+                deps.export_pcm_file_with_soundfile(
+                    spool_path,
+                    args.output,
+                    args.format,
+                    sample_rate=sample_rate,
+                    normalize=args.normalize,
+                )
             else:
                 if use_mp3_stream:
                     if mp3_export_proc is None:
@@ -1,15 +1,20 @@
+import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import warnings
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 
-from .chunking import _clean_text, _clean_text_with_paragraphs
+from .chunking import _clean_text
 from .models import BookMetadata, ParsedEpub, ParsedSection
 
+# A filesystem path or a seekable binary file object holding the EPUB archive.
+EpubSource = Union[str, os.PathLike, IO[bytes]]
+
 try:
     import ebooklib
     from ebooklib import epub
-except ImportError:  # pragma: no cover - exercised via fallback tests
+except ImportError:  # pragma: no cover - ebooklib is listed in requirements.txt
     class _EbooklibFallback:
         ITEM_COVER = "ITEM_COVER"
         ITEM_IMAGE = "ITEM_IMAGE"
@@ -18,6 +23,14 @@ except ImportError:  # pragma: no cover - exercised via fallback tests
     ebooklib = _EbooklibFallback()
     epub = None
 
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - lxml is installed with ebooklib
+    lxml = None
+
+# libxml2 builds the tree in C; html.parser remains the pure-Python fallback.
+HTML_PARSER_FEATURES = "lxml" if lxml is not None else "html.parser"
+
 
 SECTION_BLOCK_TAGS = (
     "p",
@@ -37,6 +50,7 @@ NAV_DOCUMENT_HINT_RE = re.compile(
     r"(^|[\\/._-])(nav|toc|contents?|landmarks?)([\\/._-]|$)",
     re.IGNORECASE,
 )
+NON_CONTENT_ATTR_RE = re.compile(r"\b(toc|landmarks?)\b", re.IGNORECASE)
 
 
 def _require_epub_support() -> None:
@@ -46,7 +60,7 @@ def _require_epub_support() -> None:
         )
 
 
-def _load_epub_book(epub_path: str) -> Any:
+def _load_epub_book(epub_path: EpubSource) -> Any:
     _require_epub_support()
     return epub.read_epub(epub_path)
 
@@ -93,7 +107,7 @@ def _extract_book_metadata(book: Any) -> BookMetadata:
     )
 
 
-def extract_epub_metadata(epub_path: str) -> BookMetadata:
+def extract_epub_metadata(epub_path: EpubSource) -> BookMetadata:
     book = _load_epub_book(epub_path)
     return _extract_book_metadata(book)
 
@@ -219,8 +233,7 @@ def _prune_non_content_nodes(body: Any) -> None:
             " ".join(node.get("class", [])),
         ]
         if any(
-            isinstance(value, str)
-            and re.search(r"\b(toc|landmarks?)\b", value, re.IGNORECASE)
+            isinstance(value, str) and NON_CONTENT_ATTR_RE.search(value)
             for value in attr_values
         ):
             node.decompose()
@@ -244,20 +257,12 @@ def _extract_body_text(soup: BeautifulSoup) -> str:
         if fallback_text:
             paragraphs.append(fallback_text)
 
-    return _clean_text_with_paragraphs("\n\n".join(paragraphs))
+    # Each paragraph is already whitespace-collapsed and non-empty, so a
+    # second cleaning pass over the joined chapter text would be redundant.
+    return "\n\n".join(paragraphs)
 
 
-def _resolve_section_title(
-    item: Any,
-    soup: BeautifulSoup,
-    toc_labels: Dict[str, str],
-    chapter_number: int,
-) -> str:
-    for candidate in _get_item_reference_candidates(item):
-        toc_title = toc_labels.get(candidate)
-        if toc_title:
-            return toc_title
-
+def _document_heading_title(soup: BeautifulSoup) -> Optional[str]:
     body = soup.body or soup
     for heading_tag in ("h1", "h2"):
         heading = body.find(heading_tag)
@@ -273,7 +278,69 @@ def _resolve_section_title(
         if title_text:
             return title_text
 
-    return f"Chapter {chapter_number}"
+    return None
+
+
+def _resolve_section_title(
+    item: Any,
+    heading_title: Optional[str],
+    toc_labels: Dict[str, str],
+    chapter_number: int,
+) -> str:
+    for candidate in _get_item_reference_candidates(item):
+        toc_title = toc_labels.get(candidate)
+        if toc_title:
+            return toc_title
+
+    return heading_title or f"Chapter {chapter_number}"
+
+
+def _parse_document_item(item: Any) -> Tuple[Any, str, Optional[str]]:
+    """Parse one document into ``(item, body_text, heading_title)``.
+
+    Only plain strings are kept, so the soup is released as soon as the
+    document has been parsed.
+    """
+    if _is_navigation_document(item):
+        return item, "", None
+
+    content = item.get_content()
+    # Blank documents cannot yield text; skip them without building a tree.
+    if not content or content.isspace():
+        return item, "", None
+
+    soup = BeautifulSoup(content, HTML_PARSER_FEATURES)
+    text = _extract_body_text(soup)
+    if not text:
+        return item, "", None
+    return item, text, _document_heading_title(soup)
+
+
+def _iter_document_sections(
+    book: Any,
+    parsed_items: Iterable[Tuple[Any, str, Optional[str]]],
+    total_items: int = 0,
+    progress_callback: Optional[Callable[[int, int, int], None]] = None,
+) -> Iterator[ParsedSection]:
+    """Turn parsed documents into sections, numbering them in book order."""
+    toc_labels = _build_toc_label_map(book)
+    section_count = 0
+
+    for idx, (item, text, heading_title) in enumerate(parsed_items, start=1):
+        if text:
+            section_count += 1
+            yield ParsedSection(
+                title=_resolve_section_title(item, heading_title, toc_labels, section_count),
+                text=text,
+                href=next(iter(_get_item_reference_candidates(item)), ""),
+                item_id=(
+                    item.get_id()
+                    if callable(getattr(item, "get_id", None))
+                    else ""
+                ),
+            )
+        if progress_callback is not None:
+            progress_callback(idx, total_items, section_count)
 
 
 def parse_loaded_epub(
@@ -281,34 +348,20 @@ def parse_loaded_epub(
     progress_callback: Optional[Callable[[int, int, int], None]] = None,
 ) -> ParsedEpub:
     metadata = _extract_book_metadata(book)
-    chapters: List[ParsedSection] = []
     document_items = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
-    total_items = len(document_items)
-    toc_labels = _build_toc_label_map(book)
 
-    for idx, item in enumerate(document_items, start=1):
-        if _is_navigation_document(item):
-            if progress_callback is not None:
-                progress_callback(idx, total_items, len(chapters))
-            continue
-
-        soup = BeautifulSoup(item.get_content(), "html.parser")
-        text = _extract_body_text(soup)
-        if text:
-            chapters.append(
-                ParsedSection(
-                    title=_resolve_section_title(item, soup, toc_labels, len(chapters) + 1),
-                    text=text,
-                    href=next(iter(_get_item_reference_candidates(item)), ""),
-                    item_id=(
-                        item.get_id()
-                        if callable(getattr(item, "get_id", None))
-                        else ""
-                    ),
-                )
+    # EPUB chapters are XHTML with an ``<?xml ...?>`` prolog, which bs4 flags
+    # when it is handed to an HTML builder; parsing them as HTML is intended.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+        chapters = list(
+            _iter_document_sections(
+                book,
+                map(_parse_document_item, document_items),
+                total_items=len(document_items),
+                progress_callback=progress_callback,
             )
-        if progress_callback is not None:
-            progress_callback(idx, total_items, len(chapters))
+        )
 
     if not chapters:
         raise ValueError("No readable text content found in EPUB.")
@@ -317,13 +370,13 @@ def parse_loaded_epub(
 
 
 def parse_epub(
-    epub_path: str,
+    epub_path: EpubSource,
     progress_callback: Optional[Callable[[int, int, int], None]] = None,
 ) -> ParsedEpub:
     book = _load_epub_book(epub_path)
     return parse_loaded_epub(book, progress_callback=progress_callback)
 
 
-def extract_epub_text(epub_path: str) -> List[Tuple[str, str]]:
+def extract_epub_text(epub_path: EpubSource) -> List[Tuple[str, str]]:
     return [(chapter.title, chapter.text) for chapter in parse_epub(epub_path).chapters]
 
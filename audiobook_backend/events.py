@@ -3,7 +3,43 @@ import os
 import sys
 import threading
 import time
-from typing import Any, Dict, Optional, TextIO, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
+
+
+def format_text_event(event_type: str, payload: Dict[str, Any]) -> Optional[str]:
+    """Render an event as a legacy text IPC line, or None for unknown types."""
+    if event_type == "phase":
+        return f"PHASE:{payload['phase']}"
+    if event_type == "metadata":
+        return f"METADATA:{payload['key']}:{payload['value']}"
+    if event_type == "timing":
+        return f"TIMING:{payload['chunk_idx']}:{payload['chunk_timing_ms']}"
+    if event_type == "parse_progress":
+        return (
+            "PARSE_PROGRESS:"
+            f"{payload['current_item']}/{payload['total_items']}:"
+            f"{payload['current_chapter_count']}"
+        )
+    if event_type == "heartbeat":
+        return f"HEARTBEAT:{payload['heartbeat_ts']}"
+    if event_type == "worker":
+        return f"WORKER:{payload['id']}:{payload['status']}:{payload['details']}"
+    if event_type == "progress":
+        return f"PROGRESS:{payload['current_chunk']}/{payload['total_chunks']} chunks"
+    if event_type == "checkpoint":
+        code = payload.get("code")
+        detail = payload.get("detail")
+        if detail is not None:
+            return f"CHECKPOINT:{code}:{detail}"
+        return f"CHECKPOINT:{code}"
+    if event_type == "error":
+        return payload["message"]
+    if event_type == "done":
+        return "DONE"
+    if event_type == "inspection":
+        return f"INSPECTION:{json.dumps(payload['result'], ensure_ascii=False)}"
+    return None
 
 
 class EventEmitter:
@@ -19,6 +55,7 @@ class EventEmitter:
         self.job_id = job_id
         self._log_fp: Optional[TextIO] = None
         self._write_lock = threading.Lock()
+        self._batch_depth = 0
 
         if log_file:
             log_dir = os.path.dirname(os.path.abspath(log_file))
@@ -29,10 +66,30 @@ class EventEmitter:
     def _write(self, line: str, *, stderr: bool = False) -> None:
         with self._write_lock:
             stream = sys.stderr if stderr else sys.stdout
-            print(line, file=stream, flush=True)
+            print(line, file=stream, flush=not self._batch_depth)
             if self._log_fp is not None:
                 self._log_fp.write(line + "\n")
-                self._log_fp.flush()
+                if not self._batch_depth:
+                    self._log_fp.flush()
+
+    def _flush(self) -> None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if self._log_fp is not None:
+            self._log_fp.flush()
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Defer flushing until the block exits so related events share one flush."""
+        with self._write_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._write_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush()
 
     def close(self) -> None:
         if self._log_fp is not None:
@@ -49,52 +106,9 @@ class EventEmitter:
         self._write(json.dumps(body, ensure_ascii=False))
 
     def _emit_text_event(self, event_type: str, payload: Dict[str, Any]) -> None:
-        if event_type == "phase":
-            self._write(f"PHASE:{payload['phase']}")
-            return
-        if event_type == "metadata":
-            self._write(f"METADATA:{payload['key']}:{payload['value']}")
-            return
-        if event_type == "timing":
-            self._write(f"TIMING:{payload['chunk_idx']}:{payload['chunk_timing_ms']}")
-            return
-        if event_type == "parse_progress":
-            self._write(
-                "PARSE_PROGRESS:"
-                f"{payload['current_item']}/{payload['total_items']}:"
-                f"{payload['current_chapter_count']}"
-            )
-            return
-        if event_type == "heartbeat":
-            self._write(f"HEARTBEAT:{payload['heartbeat_ts']}")
-            return
-        if event_type == "worker":
-            self._write(
-                f"WORKER:{payload['id']}:{payload['status']}:{payload['details']}"
-            )
-            return
-        if event_type == "progress":
-            self._write(
-                f"PROGRESS:{payload['current_chunk']}/{payload['total_chunks']} chunks"
-            )
-            return
-        if event_type == "checkpoint":
-            code = payload.get("code")
-            detail = payload.get("detail")
-            if detail is not None:
-                self._write(f"CHECKPOINT:{code}:{detail}")
-            else:
-                self._write(f"CHECKPOINT:{code}")
-            return
-        if event_type == "error":
-            self._write(payload["message"], stderr=True)
-            return
-        if event_type == "done":
-            self._write("DONE")
-            return
-        if event_type == "inspection":
-            self._write(f"INSPECTION:{json.dumps(payload['result'], ensure_ascii=False)}")
-            return
+        line = format_text_event(event_type, payload)
+        if line is not None:
+            self._write(line, stderr=event_type == "error")
 
     def emit(self, event_type: str, **payload: Any) -> None:
         if self.event_format == "json":
@@ -1,8 +1,11 @@
+import functools
+import itertools
 import os
 import shutil
 import subprocess
 import tempfile
-from typing import List, Optional
+import wave
+from typing import Iterable, List, Optional, Union
 
 import numpy as np
 from pydub import AudioSegment
@@ -15,27 +18,90 @@ try:
 except ImportError:
     torch = None
 
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
 
 DEFAULT_SAMPLE_RATE = 24000
+PCM_COPY_BLOCK_BYTES = 1 << 20
+# Kernel buffer for the PCM pipe into ffmpeg; the Linux default is 64 KiB.
+FFMPEG_PIPE_SIZE = 1 << 20
+PEAK_NORMALIZE_HEADROOM_DB = 1.0
+
+# --format value -> (libsndfile container, subtype)
+SOUNDFILE_FORMATS = {
+    "flac": ("FLAC", "PCM_16"),
+    "ogg": ("OGG", "VORBIS"),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg() -> str:
+    """Resolve ffmpeg on PATH once; a missing binary is re-probed next call."""
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        raise FileNotFoundError(
+            "ffmpeg not found. Install with: brew install ffmpeg"
+        )
+    return ffmpeg_path
 
 
 def audio_to_int16(audio) -> np.ndarray:
     """Convert audio tensor/array to int16 numpy array."""
     if torch is not None and isinstance(audio, torch.Tensor):
-        if audio.device.type != "cpu":
-            audio = audio.detach().cpu()
-        else:
-            audio = audio.detach()
-        audio = audio.numpy()
+        audio = audio.detach()
+        if audio.dtype != torch.int16:
+            # Quantize on the tensor's own device so only 2 bytes per sample
+            # are copied back to the host instead of 4.
+            if not audio.is_floating_point():
+                audio = audio.to(torch.float32)
+            audio = torch.clamp(audio, -1.0, 1.0).mul_(32767.0).to(torch.int16)
+        return audio.cpu().numpy()
     elif not isinstance(audio, np.ndarray):
         audio = np.asarray(audio)
 
     if audio.dtype != np.int16:
-        audio = np.clip(audio, -1.0, 1.0)
-        audio = (audio * 32767.0).astype(np.int16)
+        # Scale into one float32 scratch buffer and clip it in place; clipping
+        # after scaling is equivalent and avoids a second full-size temporary.
+        scratch = np.multiply(audio, 32767.0, dtype=np.float32)
+        np.clip(scratch, -32767.0, 32767.0, out=scratch)
+        audio = scratch.astype(np.int16)
     return audio
 
 
+def concat_and_convert_to_int16(segments: Iterable) -> np.ndarray:
+    """Concatenate audio segments into one int16 array in a single pass.
+
+    Float segments are scaled and clipped through one reusable scratch buffer
+    and written straight into their slice of the preallocated output, so no
+    per-segment int16 copies or final ``np.concatenate`` are needed.
+    """
+    parts = [
+        np.ravel(segment) if isinstance(segment, np.ndarray) else audio_to_int16(segment)
+        for segment in segments
+    ]
+    out = np.empty(sum(len(part) for part in parts), dtype=np.int16)
+    scratch = np.empty(
+        max((len(part) for part in parts if part.dtype != np.int16), default=0),
+        dtype=np.float32,
+    )
+
+    start = 0
+    for part in parts:
+        end = start + len(part)
+        if part.dtype == np.int16:
+            out[start:end] = part
+        else:
+            view = scratch[:len(part)]
+            np.multiply(part, 32767.0, out=view, casting="unsafe")
+            np.clip(view, -32767.0, 32767.0, out=view)
+            out[start:end] = view
+        start = end
+    return out
+
+
 def audio_to_segment(audio: np.ndarray, rate: int = DEFAULT_SAMPLE_RATE) -> AudioSegment:
     if audio.dtype != np.int16:
         audio = audio_to_int16(audio)
@@ -161,52 +227,53 @@ def _build_m4b_ffmpeg_command(
 
 
 def export_pcm_to_mp3(
-    pcm_data: np.ndarray,
+    pcm_data: Union[np.ndarray, Iterable[np.ndarray]],
     output_path: str,
     sample_rate: int = DEFAULT_SAMPLE_RATE,
     bitrate: str = "192k",
     normalize: bool = False,
 ) -> None:
-    ffmpeg_path = shutil.which("ffmpeg")
-    if ffmpeg_path is None:
-        raise FileNotFoundError(
-            "ffmpeg not found. Install with: brew install ffmpeg"
+    """Encode PCM audio to MP3 with a single ffmpeg process.
+
+    ``pcm_data`` may be one array or an iterable of segments (for example one
+    per chapter); segments are streamed through the same ffmpeg stdin pipe
+    instead of spawning ffmpeg once per segment.
+    """
+    ffmpeg_path = _find_ffmpeg()
+
+    if isinstance(pcm_data, np.ndarray):
+        pcm_data = [pcm_data]
+    # Float audio is scaled and saturated, never truncated or wrapped.
+    segments = (audio_to_int16(segment) for segment in pcm_data)
+    first = next((segment for segment in segments if len(segment)), None)
+
+    if first is not None:
+        proc = open_mp3_export_stream(
+            output_path,
+            sample_rate=sample_rate,
+            bitrate=bitrate,
+            normalize=normalize,
         )
-
-    if pcm_data.size == 0:
-        cmd = [
-            ffmpeg_path,
-            "-f", "lavfi",
-            "-i", "anullsrc=r=24000:cl=mono",
-            "-t", "0.1",
-            "-b:a", bitrate,
-            "-y", output_path,
-        ]
-        subprocess.run(cmd, check=True, capture_output=True)
+        try:
+            for segment in itertools.chain([first], segments):
+                # Pipe the array's own buffer; tobytes() would copy the whole book.
+                pcm = np.ascontiguousarray(segment)
+                proc.stdin.write(memoryview(pcm).cast("B"))
+        except BrokenPipeError:
+            # ffmpeg exited early; close_mp3_export_stream reports why.
+            pass
+        close_mp3_export_stream(proc)
         return
 
-    if pcm_data.dtype != np.int16:
-        pcm_data = pcm_data.astype(np.int16)
-
     cmd = [
         ffmpeg_path,
-        "-f", "s16le",
-        "-ar", str(sample_rate),
-        "-ac", "1",
-        "-i", "pipe:0",
-    ]
-
-    if normalize:
-        cmd.extend(["-af", "loudnorm=I=-14:TP=-1:LRA=11"])
-
-    cmd.extend([
+        "-f", "lavfi",
+        "-i", "anullsrc=r=24000:cl=mono",
+        "-t", "0.1",
         "-b:a", bitrate,
         "-y", output_path,
-    ])
-
-    proc = subprocess.run(cmd, input=pcm_data.tobytes(), capture_output=True)
-    if proc.returncode != 0:
-        raise RuntimeError(f"ffmpeg failed: {proc.stderr.decode()}")
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, close_fds=False)
 
 
 def export_pcm_to_m4b(
@@ -218,11 +285,7 @@ def export_pcm_to_m4b(
     bitrate: str = "192k",
     normalize: bool = False,
 ) -> None:
-    ffmpeg_path = shutil.which("ffmpeg")
-    if ffmpeg_path is None:
-        raise FileNotFoundError(
-            "ffmpeg not found. Install with: brew install ffmpeg"
-        )
+    ffmpeg_path = _find_ffmpeg()
 
     if pcm_data.dtype != np.int16:
         pcm_data = audio_to_int16(pcm_data)
@@ -278,11 +341,7 @@ def export_pcm_file_to_mp3(
     bitrate: str = "192k",
     normalize: bool = False,
 ) -> None:
-    ffmpeg_path = shutil.which("ffmpeg")
-    if ffmpeg_path is None:
-        raise FileNotFoundError(
-            "ffmpeg not found. Install with: brew install ffmpeg"
-        )
+    ffmpeg_path = _find_ffmpeg()
 
     if not os.path.exists(pcm_path) or os.path.getsize(pcm_path) == 0:
         cmd = [
@@ -317,17 +376,121 @@ def export_pcm_file_to_mp3(
         raise RuntimeError(f"ffmpeg failed: {proc.stderr.decode()}")
 
 
+def pcm_file_peak(pcm_path: str) -> int:
+    """Return the absolute peak sample value of a raw s16le PCM file."""
+    samples = np.memmap(pcm_path, dtype=np.int16, mode="r")
+    block_samples = PCM_COPY_BLOCK_BYTES // 2
+    peak = 0
+    for start in range(0, samples.size, block_samples):
+        block = samples[start:start + block_samples]
+        # max/-min instead of abs(): abs(-32768) overflows int16.
+        peak = max(peak, int(block.max()), -int(block.min()))
+    return peak
+
+
+def peak_normalize_gain(peak: int, headroom_db: float = PEAK_NORMALIZE_HEADROOM_DB) -> float:
+    """Gain that brings ``peak`` to ``headroom_db`` below int16 full scale.
+
+    This only bounds the sample peak. Unlike ``loudnorm``, which targets an
+    integrated loudness of about -14 LUFS, it does not set perceived
+    loudness, so peak-normalized output will not match the MP3/M4B level.
+    """
+    if peak <= 0:
+        return 1.0
+    target_peak = 32767.0 * 10 ** (-headroom_db / 20)
+    return target_peak / peak
+
+
+def scale_int16(pcm: np.ndarray, gain: float) -> np.ndarray:
+    """Apply ``gain`` to int16 PCM with saturation, in one vectorized pass."""
+    scaled = np.multiply(pcm, np.float32(gain), dtype=np.float32)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
+
+
+def export_pcm_file_to_wav(
+    pcm_path: str,
+    output_path: str,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    normalize: bool = False,
+) -> None:
+    """Wrap spooled s16le PCM in a WAV header without spawning ffmpeg.
+
+    With ``normalize`` the audio is peak-normalized to -1 dBFS in NumPy,
+    since the ffmpeg ``loudnorm`` filter is not available on this path.
+    """
+    has_audio = os.path.exists(pcm_path) and os.path.getsize(pcm_path) > 0
+
+    with wave.open(output_path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+
+        if not has_audio:
+            wav_file.writeframes(bytes(2 * int(sample_rate * 0.1)))
+            return
+
+        gain = peak_normalize_gain(pcm_file_peak(pcm_path)) if normalize else 1.0
+
+        with open(pcm_path, "rb") as pcm_file:
+            while True:
+                block = pcm_file.read(PCM_COPY_BLOCK_BYTES)
+                if not block:
+                    break
+                if gain != 1.0:
+                    block = scale_int16(np.frombuffer(block, dtype=np.int16), gain).tobytes()
+                wav_file.writeframes(block)
+
+
+def export_pcm_file_with_soundfile(
+    pcm_path: str,
+    output_path: str,
+    output_format: str,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    normalize: bool = False,
+) -> None:
+    """Encode spooled s16le PCM to FLAC or Ogg Vorbis in-process with libsndfile.
+
+    The spool is streamed in blocks, so no ffmpeg process is spawned and the
+    full book is never held in memory. ``normalize`` behaves as for WAV.
+    """
+    if soundfile is None:
+        raise RuntimeError(
+            f"{output_format.upper()} export requires soundfile. Install with: pip install soundfile"
+        )
+    container, subtype = SOUNDFILE_FORMATS[output_format]
+    has_audio = os.path.exists(pcm_path) and os.path.getsize(pcm_path) > 0
+
+    with soundfile.SoundFile(
+        output_path,
+        mode="w",
+        samplerate=sample_rate,
+        channels=1,
+        format=container,
+        subtype=subtype,
+    ) as sound_file:
+        if not has_audio:
+            sound_file.write(np.zeros(int(sample_rate * 0.1), dtype=np.int16))
+            return
+
+        gain = peak_normalize_gain(pcm_file_peak(pcm_path)) if normalize else 1.0
+        samples = np.memmap(pcm_path, dtype=np.int16, mode="r")
+        block_samples = PCM_COPY_BLOCK_BYTES // 2
+        for start in range(0, samples.size, block_samples):
+            block = samples[start:start + block_samples]
+            if gain != 1.0:
+                block = scale_int16(block, gain)
+            sound_file.write(block)
+
+
 def open_mp3_export_stream(
     output_path: str,
     sample_rate: int = DEFAULT_SAMPLE_RATE,
     bitrate: str = "192k",
     normalize: bool = False,
 ) -> subprocess.Popen:
-    ffmpeg_path = shutil.which("ffmpeg")
-    if ffmpeg_path is None:
-        raise FileNotFoundError(
-            "ffmpeg not found. Install with: brew install ffmpeg"
-        )
+    ffmpeg_path = _find_ffmpeg()
 
     cmd = [
         ffmpeg_path,
@@ -345,24 +508,45 @@ def open_mp3_export_stream(
         "-y", output_path,
     ])
 
-    return subprocess.Popen(
-        cmd,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
+    # close_fds=False lets CPython launch ffmpeg via posix_spawn instead of
+    # fork+exec, which stays cheap while a multi-GB model is resident. Our
+    # own fds are non-inheritable by default (PEP 446), so nothing leaks.
+    #
+    # ffmpeg's stderr goes to an anonymous temp file rather than a PIPE: it
+    # is only read if ffmpeg fails, and a file can never fill up and stall
+    # ffmpeg while we are blocked writing PCM to its stdin.
+    stderr_log = tempfile.TemporaryFile()
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_log,
+            pipesize=FFMPEG_PIPE_SIZE,
+            close_fds=False,
+        )
+    except BaseException:
+        stderr_log.close()
+        raise
+    proc.stderr = stderr_log
+    return proc
 
 
 def close_mp3_export_stream(proc: subprocess.Popen) -> None:
     if proc.stdin is not None:
         proc.stdin.close()
-    stderr = b""
-    if proc.stderr is not None:
-        stderr = proc.stderr.read()
-    return_code = proc.wait()
-    if return_code != 0:
-        err = stderr.decode("utf-8", errors="replace")
-        raise RuntimeError(f"ffmpeg failed: {err}")
+    try:
+        return_code = proc.wait()
+        if return_code != 0:
+            stderr = b""
+            if proc.stderr is not None:
+                proc.stderr.seek(0)
+                stderr = proc.stderr.read()
+            err = stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(f"ffmpeg failed: {err}")
+    finally:
+        if proc.stderr is not None:
+            proc.stderr.close()
 
 
 def export_pcm_file_to_m4b(
@@ -374,11 +558,7 @@ def export_pcm_file_to_m4b(
     bitrate: str = "192k",
     normalize: bool = False,
 ) -> None:
-    ffmpeg_path = shutil.which("ffmpeg")
-    if ffmpeg_path is None:
-        raise FileNotFoundError(
-            "ffmpeg not found. Install with: brew install ffmpeg"
-        )
+    ffmpeg_path = _find_ffmpeg()
 
     temp_files = []
     try:
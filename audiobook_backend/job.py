@@ -80,18 +80,31 @@ def build_checkpoint_config(
     }
 
 
+def resolve_backend_and_device(
+    args: argparse.Namespace,
+    deps: Optional[JobPreparationDeps] = None,
+) -> tuple[str, str, list[str]]:
+    """Return ``(resolved_backend, resolved_device, device_warnings)`` for ``args``."""
+    deps = deps or DEFAULT_PREPARATION_DEPS
+    resolved_backend = deps.resolve_backend(args.backend)
+    resolved_device, device_warnings = deps.resolve_device_for_args(args, resolved_backend)
+    return resolved_backend, resolved_device, device_warnings
+
+
 def prepare_job(
     args: argparse.Namespace,
     *,
     inspect_checkpoint_state: bool,
     progress_callback: Optional[Callable[[int, int, int], None]] = None,
     deps: Optional[JobPreparationDeps] = None,
+    backend_resolution: Optional[tuple[str, str, list[str]]] = None,
 ) -> PreparedJob:
     deps = deps or DEFAULT_PREPARATION_DEPS
     checkpoint_dir = deps.get_checkpoint_dir(args.output)
     use_checkpoint = args.checkpoint or args.resume
-    resolved_backend = deps.resolve_backend(args.backend)
-    resolved_device, device_warnings = deps.resolve_device_for_args(args, resolved_backend)
+    resolved_backend, resolved_device, device_warnings = (
+        backend_resolution or resolve_backend_and_device(args, deps)
+    )
     chunk_chars = (
         args.chunk_chars
         if args.chunk_chars is not None
@@ -115,7 +128,7 @@ def prepare_job(
     parsed_epub = deps.parse_epub(args.input, progress_callback=progress_callback)
     chapters = parsed_epub.chapters
     chunks, chapter_start_indices = deps.split_text_to_chunks(chapters, chunk_chars)
-    total_chars = sum(len(chunk.text) for chunk in chunks)
+    total_chars = sum(chunk.nchars for chunk in chunks)
 
     if not chunks:
         raise ValueError("No text chunks produced from EPUB.")
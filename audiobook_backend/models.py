@@ -1,11 +1,22 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class TextChunk:
     chapter_title: str
     text: str
+    # Cached len(text); books can yield thousands of chunks and several
+    # passes (job totals, cache admission) only need the size.
+    nchars: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.nchars = len(self.text)
+
+
+class SplitResult(NamedTuple):
+    chunks: List[TextChunk]
+    chapter_starts: List[Tuple[int, str]]
 
 
 @dataclass
@@ -1,6 +1,8 @@
+import functools
 import queue
 import threading
 import time
+from collections import OrderedDict
 from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
@@ -10,7 +12,7 @@ import numpy as np
 from checkpoint import CheckpointState, load_chunk_audio, save_checkpoint, save_chunk_audio
 
 from .events import EventEmitter
-from .export import audio_to_int16
+from .export import audio_to_int16, concat_and_convert_to_int16
 
 
 @dataclass
@@ -21,6 +23,38 @@ class PipelineRunResult:
     completed_chunks: list[int]
 
 
+class SynthesisCache:
+    """Bounded LRU of synthesized int16 PCM for short, repeated chunk texts.
+
+    Entries are stored as tuples of ``bytes`` so cached audio cannot be
+    mutated by consumers. Only texts up to ``max_text_chars`` are cached to
+    keep memory bounded; long chunks are effectively never repeated.
+    """
+
+    def __init__(self, max_entries: int = 128, max_text_chars: int = 160) -> None:
+        self.max_entries = max_entries
+        self.max_text_chars = max_text_chars
+        self._entries: OrderedDict[tuple, tuple[bytes, ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def accepts(self, nchars: int) -> bool:
+        return self.max_entries > 0 and nchars <= self.max_text_chars
+
+    def get(self, key: tuple) -> Optional[tuple[bytes, ...]]:
+        parts = self._entries.get(key)
+        if parts is not None:
+            self._entries.move_to_end(key)
+        return parts
+
+    def put(self, key: tuple, parts: tuple[bytes, ...]) -> None:
+        self._entries[key] = parts
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
 def run_sequential_pipeline(
     *,
     chunks: list[Any],
@@ -43,6 +77,7 @@ def run_sequential_pipeline(
     save_chunk_audio_fn: Callable[..., None] = save_chunk_audio,
     save_checkpoint_fn: Callable[..., None] = save_checkpoint,
     audio_to_int16_fn: Callable[[Any], np.ndarray] = audio_to_int16,
+    synthesis_cache: Optional[SynthesisCache] = None,
 ) -> PipelineRunResult:
     total_chunks = len(chunks)
     chunk_sample_offsets: list[int] = [0] * total_chunks
@@ -50,6 +85,16 @@ def run_sequential_pipeline(
     times: list[float] = []
     last_heartbeat = time.time()
     processed_count = 0
+    if synthesis_cache is None:
+        synthesis_cache = SynthesisCache()
+    # Bind per-run options once instead of rebuilding kwargs for every chunk.
+    synthesize = functools.partial(
+        backend.generate,
+        voice=voice,
+        speed=speed,
+        split_pattern=split_pattern,
+    )
+    perf_counter = time.perf_counter
 
     def emit_heartbeat_if_needed() -> None:
         nonlocal last_heartbeat
@@ -73,15 +118,18 @@ def run_sequential_pipeline(
                 if chunk_audio is not None:
                     if chunk_audio.dtype != np.int16:
                         chunk_audio = audio_to_int16_fn(chunk_audio)
+                    # Write straight from the (memory-mapped) buffer rather than
+                    # materializing a bytes copy of the whole chunk.
+                    chunk_bytes = memoryview(np.ascontiguousarray(chunk_audio)).cast("B")
 
                     if use_mp3_stream:
                         if mp3_export_proc is None or mp3_export_proc.stdin is None:
                             raise RuntimeError("MP3 export process is not writable.")
-                        mp3_export_proc.stdin.write(chunk_audio.tobytes())
+                        mp3_export_proc.stdin.write(chunk_bytes)
                     else:
                         if spool is None:
                             raise RuntimeError("Spool writer is not available.")
-                        spool.write(chunk_audio.tobytes())
+                        spool.write(chunk_bytes)
 
                     cumulative_samples += len(chunk_audio)
                     reused_checkpoint_audio = True
@@ -100,7 +148,7 @@ def run_sequential_pipeline(
                     events.emit("checkpoint", code="MISSING_AUDIO", detail=idx)
 
             if not reused_checkpoint_audio:
-                start = time.perf_counter()
+                start = perf_counter()
                 events.emit(
                     "worker",
                     id=0,
@@ -109,58 +157,72 @@ def run_sequential_pipeline(
                 )
 
                 checkpoint_parts: Optional[list[np.ndarray]] = [] if use_checkpoint else None
-                for audio in backend.generate(
-                    text=chunk.text,
-                    voice=voice,
-                    speed=speed,
-                    split_pattern=split_pattern,
-                ):
+                cache_key = (voice, speed, split_pattern, chunk.text)
+                cacheable = synthesis_cache.accepts(chunk.nchars)
+                cached_parts = synthesis_cache.get(cache_key) if cacheable else None
+                if cached_parts is not None:
+                    audio_stream = (
+                        np.frombuffer(part, dtype=np.int16) for part in cached_parts
+                    )
+                else:
+                    audio_stream = synthesize(text=chunk.text)
+                new_cache_parts: Optional[list[bytes]] = (
+                    [] if cacheable and cached_parts is None else None
+                )
+
+                for audio in audio_stream:
                     int16_audio = audio_to_int16_fn(audio)
+                    pcm_bytes = int16_audio.tobytes()
                     if use_mp3_stream:
                         if mp3_export_proc is None or mp3_export_proc.stdin is None:
                             raise RuntimeError("MP3 export process is not writable.")
-                        mp3_export_proc.stdin.write(int16_audio.tobytes())
+                        mp3_export_proc.stdin.write(pcm_bytes)
                     else:
                         if spool is None:
                             raise RuntimeError("Spool writer is not available.")
-                        spool.write(int16_audio.tobytes())
+                        spool.write(pcm_bytes)
                     cumulative_samples += len(int16_audio)
 
                     if checkpoint_parts is not None:
                         checkpoint_parts.append(int16_audio)
+                    if new_cache_parts is not None:
+                        new_cache_parts.append(pcm_bytes)
+
+                if new_cache_parts is not None:
+                    synthesis_cache.put(cache_key, tuple(new_cache_parts))
 
-                elapsed = time.perf_counter() - start
+                elapsed = perf_counter() - start
                 times.append(elapsed)
 
-                if checkpoint_parts is not None:
-                    if checkpoint_parts:
-                        chunk_audio = np.concatenate(checkpoint_parts)
-                    else:
-                        chunk_audio = np.array([], dtype=np.int16)
-                    save_chunk_audio_fn(checkpoint_dir, idx, chunk_audio)
-                    completed_chunks.add(idx)
-                    if checkpoint_state is not None:
-                        checkpoint_state.completed_chunks = sorted(completed_chunks)
-                        save_checkpoint_fn(checkpoint_dir, checkpoint_state)
-                    events.emit("checkpoint", code="SAVED", detail=idx)
+            # End-of-chunk events go out with a single flush.
+            with events.batched():
+                if not reused_checkpoint_audio:
+                    if checkpoint_parts is not None:
+                        chunk_audio = concat_and_convert_to_int16(checkpoint_parts)
+                        save_chunk_audio_fn(checkpoint_dir, idx, chunk_audio)
+                        completed_chunks.add(idx)
+                        if checkpoint_state is not None:
+                            checkpoint_state.completed_chunks = sorted(completed_chunks)
+                            save_checkpoint_fn(checkpoint_dir, checkpoint_state)
+                        events.emit("checkpoint", code="SAVED", detail=idx)
 
-                events.emit(
-                    "timing",
-                    chunk_idx=idx,
-                    chunk_timing_ms=int(elapsed * 1000),
-                    stage="infer",
-                )
+                    events.emit(
+                        "timing",
+                        chunk_idx=idx,
+                        chunk_timing_ms=int(elapsed * 1000),
+                        stage="infer",
+                    )
 
-            processed_count += 1
-            emit_heartbeat_if_needed()
+                processed_count += 1
+                emit_heartbeat_if_needed()
 
-            if progress and task_id is not None:
-                progress.update(task_id, advance=1)
-            events.emit(
-                "progress",
-                current_chunk=processed_count,
-                total_chunks=total_chunks,
-            )
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                events.emit(
+                    "progress",
+                    current_chunk=processed_count,
+                    total_chunks=total_chunks,
+                )
 
     return PipelineRunResult(
         chunk_sample_offsets=chunk_sample_offsets,
@@ -208,20 +270,24 @@ def run_overlap3_pipeline(
             events.emit("heartbeat", heartbeat_ts=int(now * 1000))
             last_heartbeat = now
 
+    synthesize = functools.partial(
+        backend.generate,
+        voice=voice,
+        speed=speed,
+        split_pattern=split_pattern,
+    )
+
     def inference_worker() -> None:
+        perf_counter = time.perf_counter
+        put = inference_queue.put
         try:
             for idx, chunk in enumerate(chunks):
-                inference_queue.put(("start", idx, None))
-                start = time.perf_counter()
-                for audio in backend.generate(
-                    text=chunk.text,
-                    voice=voice,
-                    speed=speed,
-                    split_pattern=split_pattern,
-                ):
-                    inference_queue.put(("audio", idx, audio))
-                infer_ms = int((time.perf_counter() - start) * 1000)
-                inference_queue.put(("done", idx, infer_ms))
+                put(("start", idx, None))
+                start = perf_counter()
+                for audio in synthesize(text=chunk.text):
+                    put(("audio", idx, audio))
+                infer_ms = int((perf_counter() - start) * 1000)
+                put(("done", idx, infer_ms))
         except Exception as exc:  # pragma: no cover - exercised via integration path
             worker_errors.put(exc)
         finally:
@@ -292,28 +358,29 @@ def run_overlap3_pipeline(
             if kind == "done":
                 infer_ms = int(payload)
                 times.append(infer_ms / 1000.0)
-                events.emit(
-                    "worker",
-                    id=0,
-                    status="ENCODE",
-                    details=f"Chunk {idx+1}/{total_chunks}",
-                )
-                events.emit(
-                    "timing",
-                    chunk_idx=idx,
-                    chunk_timing_ms=infer_ms,
-                    stage="infer",
-                )
+                with events.batched():
+                    events.emit(
+                        "worker",
+                        id=0,
+                        status="ENCODE",
+                        details=f"Chunk {idx+1}/{total_chunks}",
+                    )
+                    events.emit(
+                        "timing",
+                        chunk_idx=idx,
+                        chunk_timing_ms=infer_ms,
+                        stage="infer",
+                    )
 
-                processed_count += 1
-                if progress and task_id is not None:
-                    progress.update(task_id, advance=1)
-                events.emit(
-                    "progress",
-                    current_chunk=processed_count,
-                    total_chunks=total_chunks,
-                )
-                emit_heartbeat_if_needed()
+                    processed_count += 1
+                    if progress and task_id is not None:
+                        progress.update(task_id, advance=1)
+                    events.emit(
+                        "progress",
+                        current_chunk=processed_count,
+                        total_chunks=total_chunks,
+                    )
+                    emit_heartbeat_if_needed()
                 continue
 
             raise RuntimeError(f"Unknown overlap3 pipeline message type: {kind}")
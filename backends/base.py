@@ -1,10 +1,18 @@
 """Abstract base class for TTS backends."""
 
+import functools
+import re
 from abc import ABC, abstractmethod
 from typing import Generator, Any
 import numpy as np
 
 
+@functools.lru_cache(maxsize=16)
+def compile_split_pattern(split_pattern: str) -> "re.Pattern[str]":
+    """Compile a segment split regex once per pattern, shared by all backends."""
+    return re.compile(split_pattern)
+
+
 class TTSBackend(ABC):
     """Abstract base class for TTS backends.
 
@@ -77,7 +77,8 @@ class KokoroPyTorchBackend(TTSBackend):
             split_pattern: Regex for internal text splitting
 
         Yields:
-            Audio arrays (torch tensors that will be converted to numpy)
+            Audio arrays (raw torch tensors, left on their device so
+            audio_to_int16 can quantize them before the host copy)
         """
         if self._pipeline is None:
             raise RuntimeError("Backend not initialized. Call initialize() first.")
@@ -1,11 +1,10 @@
 """Deterministic mock backend for end-to-end tests."""
 
-import re
 from typing import Generator
 
 import numpy as np
 
-from .base import TTSBackend
+from .base import TTSBackend, compile_split_pattern
 
 
 class MockTTSBackend(TTSBackend):
@@ -37,7 +36,7 @@ class MockTTSBackend(TTSBackend):
         if not self._initialized:
             raise RuntimeError("Mock backend not initialized. Call initialize() first.")
 
-        segments = [seg.strip() for seg in re.split(split_pattern, text) if seg.strip()]
+        segments = [seg.strip() for seg in compile_split_pattern(split_pattern).split(text) if seg.strip()]
         if not segments and text.strip():
             segments = [text.strip()]
 
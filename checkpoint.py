@@ -1,5 +1,6 @@
 """Checkpoint management for resumable audiobook generation."""
 
+import functools
 import hashlib
 import json
 import os
@@ -9,6 +10,11 @@ from typing import Dict, List, Optional, Any, Tuple
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class CheckpointState:
@@ -45,8 +51,20 @@ class CheckpointInspection:
     missing_audio_chunks: Optional[List[int]] = None
 
 
-def compute_epub_hash(epub_path: str) -> str:
-    """Compute SHA-256 hash of EPUB file for verification."""
+def _dump_state_bytes(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _load_state_bytes(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_epub_hash(epub_path: str, mtime_ns: int, size: int) -> str:
     hasher = hashlib.sha256()
     with open(epub_path, 'rb') as f:
         # Read in chunks to handle large files
@@ -55,6 +73,16 @@ def compute_epub_hash(epub_path: str) -> str:
     return hasher.hexdigest()
 
 
+def compute_epub_hash(epub_path: str) -> str:
+    """Compute SHA-256 hash of EPUB file for verification.
+
+    Results are memoized on (path, mtime, size), so repeated checks of an
+    unchanged file cost one stat instead of a full read.
+    """
+    stat = os.stat(epub_path)
+    return _cached_epub_hash(os.path.abspath(epub_path), stat.st_mtime_ns, stat.st_size)
+
+
 def get_checkpoint_dir(output_path: str) -> str:
     """Get the checkpoint directory path for a given output file."""
     return f"{output_path}.checkpoint"
@@ -64,8 +92,8 @@ def save_checkpoint(checkpoint_dir: str, state: CheckpointState) -> None:
     """Save checkpoint state to disk."""
     os.makedirs(checkpoint_dir, exist_ok=True)
     state_path = os.path.join(checkpoint_dir, 'state.json')
-    with open(state_path, 'w') as f:
-        json.dump(state.to_dict(), f, indent=2)
+    with open(state_path, 'wb') as f:
+        f.write(_dump_state_bytes(state.to_dict()))
 
 
 def load_checkpoint(checkpoint_dir: str) -> Optional[CheckpointState]:
@@ -74,10 +102,10 @@ def load_checkpoint(checkpoint_dir: str) -> Optional[CheckpointState]:
     if not os.path.exists(state_path):
         return None
     try:
-        with open(state_path, 'r') as f:
-            data = json.load(f)
+        with open(state_path, 'rb') as f:
+            data = _load_state_bytes(f.read())
         return CheckpointState.from_dict(data)
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (ValueError, KeyError, TypeError):
         return None
 
 
@@ -89,12 +117,16 @@ def save_chunk_audio(checkpoint_dir: str, chunk_idx: int, audio: np.ndarray) ->
 
 
 def load_chunk_audio(checkpoint_dir: str, chunk_idx: int) -> Optional[np.ndarray]:
-    """Load a single chunk's audio data from the checkpoint directory."""
+    """Load a single chunk's audio data from the checkpoint directory.
+
+    The array is memory-mapped read-only, so resumed chunks are streamed from
+    the page cache instead of being copied into process memory.
+    """
     chunk_path = os.path.join(checkpoint_dir, f'chunk_{chunk_idx:06d}.npy')
     if not os.path.exists(chunk_path):
         return None
     try:
-        return np.load(chunk_path)
+        return np.load(chunk_path, mmap_mode="r")
     except (IOError, ValueError):
         return None
 
@@ -1,7 +1,6 @@
 """Shared pytest fixtures for all tests."""
 
 import os
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -9,8 +8,38 @@ from unittest.mock import MagicMock, patch
 import pytest
 import numpy as np
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Import the app facade once per session; the test modules' own
+# ``from app import ...`` lines then resolve from sys.modules.
+import app
+from audiobook_backend.export import _find_ffmpeg
+from backends import create_backend
+
+
+@pytest.fixture(scope="session")
+def shared_mock_backend():
+    """One mock TTS backend instance shared by the whole session.
+
+    ``main()`` calls ``initialize()`` and ``cleanup()`` on every run, and the
+    mock backend keeps no other state, so sharing it between runs is safe.
+    """
+    return create_backend("mock")
+
+
+@pytest.fixture(autouse=True)
+def _fast_backend(monkeypatch, shared_mock_backend):
+    """Serve ``app.create_backend("mock")`` from the shared mock backend.
+
+    Every other backend name still goes to the real factory. Tests that
+    patch ``app.create_backend`` themselves still take precedence.
+    """
+    real_create_backend = app.create_backend
+
+    def create_backend_sharing_mock(backend_type):
+        if backend_type == "mock":
+            return shared_mock_backend
+        return real_create_backend(backend_type)
+
+    monkeypatch.setattr(app, "create_backend", create_backend_sharing_mock)
 
 
 @pytest.fixture
@@ -27,7 +56,7 @@ def sample_epub_path():
 
 
 @pytest.fixture
-def mock_kpipeline():
+def mock_kpipeline(mock_audio_frame):
     """Mock KPipeline for testing without loading the model."""
     with patch("app.KPipeline") as mock:
         # Create a mock pipeline that yields audio segments
@@ -37,9 +66,8 @@ def mock_kpipeline():
             # Yield mock audio segments based on text length
             segment_count = max(1, len(text) // 200)
             for i in range(segment_count):
-                # Create mock audio: (graphemes, phonemes, audio_array)
-                mock_audio = np.random.randn(24000).astype(np.float32)  # 1 second of audio
-                yield (f"segment_{i}", f"phonemes_{i}", mock_audio)
+                # Yield mock audio: (graphemes, phonemes, audio_array)
+                yield (f"segment_{i}", f"phonemes_{i}", mock_audio_frame)
 
         mock_instance.side_effect = mock_call
         mock_instance.return_value = mock_call
@@ -104,6 +132,39 @@ def sample_audio_int16():
     return np.array([16383, -16383, 32767, -32767, 0, 9830, -26214], dtype=np.int16)
 
 
+@pytest.fixture(autouse=True)
+def _reset_ffmpeg_lookup():
+    """Let each test re-probe ffmpeg so shutil.which patches take effect."""
+    _find_ffmpeg.cache_clear()
+    yield
+    _find_ffmpeg.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def mock_audio_frame():
+    """One second of silent float32 audio, shared across tests."""
+    return np.zeros(24000, dtype=np.float32)
+
+
+class RecordingPipeline:
+    """Kokoro pipeline stand-in that records calls without MagicMock overhead."""
+
+    def __init__(self, ret=()):
+        # A callable ``ret`` is invoked like a side effect; anything else is returned.
+        self.ret = ret
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret(*args, **kwargs) if callable(self.ret) else self.ret
+
+
+@pytest.fixture
+def mock_pipeline():
+    """Stand-in for a Kokoro pipeline that yields no segments by default."""
+    return RecordingPipeline()
+
+
 @pytest.fixture
 def mock_ffmpeg(temp_dir):
     """Mock ffmpeg subprocess for testing export."""
@@ -115,6 +176,19 @@ def mock_ffmpeg(temp_dir):
             yield mock_run
 
 
+@pytest.fixture
+def mock_ffmpeg_stream(temp_dir):
+    """Mock the streaming ffmpeg Popen used by MP3 export."""
+    proc = MagicMock(returncode=0)
+    proc.wait.return_value = 0
+
+    with patch("shutil.which") as mock_which:
+        mock_which.return_value = "/usr/bin/ffmpeg"
+
+        with patch("subprocess.Popen", return_value=proc) as mock_popen:
+            yield mock_popen
+
+
 @pytest.fixture
 def capture_stdout(capsys):
     """Capture stdout for testing IPC messages."""
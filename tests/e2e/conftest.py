@@ -0,0 +1,30 @@
+"""Shared fixtures for CLI end-to-end tests."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+import app
+
+
+SAMPLE_EPUB = Path(__file__).resolve().parents[1] / "fixtures" / "sample.epub"
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_epub():
+    """Parse the sample EPUB once per test session."""
+    return app.parse_epub(str(SAMPLE_EPUB))
+
+
+@pytest.fixture
+def cached_epub_parse(monkeypatch, parsed_sample_epub):
+    """Serve the session-parsed sample EPUB to in-process ``main()`` runs."""
+    monkeypatch.setattr(app, "parse_epub", lambda *args, **kwargs: parsed_sample_epub)
+    return parsed_sample_epub
+
+
+@pytest.fixture(scope="session")
+def ffmpeg_paths():
+    """Resolve ffmpeg/ffprobe on PATH once per test session."""
+    return {"ffmpeg": shutil.which("ffmpeg"), "ffprobe": shutil.which("ffprobe")}
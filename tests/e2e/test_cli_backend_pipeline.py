@@ -1,48 +1,165 @@
-"""Subprocess end-to-end tests for CLI/backend integration."""
+"""End-to-end tests for CLI/backend integration.
 
+Most tests drive ``app.main()`` in-process so interpreter startup and imports
+are paid once per test session; one test still spawns ``app.py`` as a real
+subprocess to cover process-level behavior.
+
+``test_mock_backend_mp3_end_to_end`` runs the real EPUB parser; the other
+pipeline tests reuse a session-scoped parse via ``cached_epub_parse``.
+"""
+
+import io
 import json
-import os
-import shutil
+import re
 import subprocess
 import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from functools import cached_property
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+import app
+from tests.e2e.conftest import SAMPLE_EPUB
+
+try:
+    import av
+except ImportError:
+    av = None
+
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 APP_PATH = ROOT_DIR / "app.py"
-SAMPLE_EPUB = ROOT_DIR / "tests" / "fixtures" / "sample.epub"
 SUPPORTED_RUNTIME = (3, 10) <= sys.version_info < (3, 13)
+_PHASE_RE = re.compile(r"PHASE:(PARSING|INFERENCE|CONCATENATING|EXPORTING)")
+
+
+def run_app(args: list[str]) -> SimpleNamespace:
+    """Run ``app.main()`` in-process, mirroring a ``CompletedProcess`` result."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    returncode = 0
+    with patch.object(sys, "argv", [str(APP_PATH), *args, "--no_rich"]):
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                app.main()
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    returncode = exc.code or 0
+                else:
+                    print(exc.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    return SimpleNamespace(
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        returncode=returncode,
+    )
+
+
+class LazyTextResult:
+    """Wrap a bytes ``CompletedProcess`` and decode output only when read."""
+
+    def __init__(self, proc: subprocess.CompletedProcess[bytes]):
+        self.returncode = proc.returncode
+        self._stdout = proc.stdout
+        self._stderr = proc.stderr
 
+    @cached_property
+    def stdout(self) -> str:
+        return self._stdout.decode("utf-8", errors="replace")
 
-def run_app(args: list[str], env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
+    @cached_property
+    def stderr(self) -> str:
+        return self._stderr.decode("utf-8", errors="replace")
+
+
+def run_app_subprocess(args: list[str]) -> LazyTextResult:
     command = [sys.executable, str(APP_PATH), *args, "--no_rich"]
-    return subprocess.run(
-        command,
+    return LazyTextResult(
+        subprocess.run(
+            command,
+            capture_output=True,
+            timeout=120,
+        )
+    )
+
+
+def probe_media(path: Path, ffprobe_path: str | None) -> dict:
+    """Return ffprobe-style format/stream/chapter data for ``path``.
+
+    Uses PyAV in-process when it is installed and falls back to an ffprobe
+    subprocess otherwise.
+    """
+    if av is not None:
+        with av.open(str(path)) as container:
+            return {
+                "format": {"tags": dict(container.metadata)},
+                "streams": [
+                    {
+                        "disposition": {
+                            "attached_pic": int(
+                                bool(stream.disposition & av.stream.Disposition.attached_pic)
+                            )
+                        }
+                    }
+                    for stream in container.streams
+                ],
+                "chapters": [
+                    {"tags": dict(chapter.get("metadata", {}))}
+                    for chapter in container.chapters()
+                ],
+            }
+
+    ffprobe = subprocess.run(
+        [
+            ffprobe_path,
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_streams",
+            "-show_chapters",
+            "-show_format",
+            str(path),
+        ],
         capture_output=True,
         text=True,
-        env=env,
-        timeout=120,
+        timeout=30,
     )
+    assert ffprobe.returncode == 0, ffprobe.stderr
+    return json.loads(ffprobe.stdout)
+
+
+def assert_nonempty_file(path: Path) -> None:
+    """Assert ``path`` exists and has content, with a single stat call."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        pytest.fail(f"output not created: {path}")
+    assert size > 0, f"output is empty: {path}"
 
 
 def assert_phase_order(stdout: str) -> None:
-    required_phases = [
-        "PHASE:PARSING",
-        "PHASE:INFERENCE",
-        "PHASE:CONCATENATING",
-        "PHASE:EXPORTING",
-    ]
+    required_phases = ["PARSING", "INFERENCE", "CONCATENATING", "EXPORTING"]
 
-    positions = [stdout.find(phase) for phase in required_phases]
-    assert all(pos != -1 for pos in positions), f"Missing phase(s). stdout:\n{stdout}"
+    found = [match.group(1) for match in _PHASE_RE.finditer(stdout)]
+    assert all(phase in found for phase in required_phases), (
+        f"Missing phase(s). stdout:\n{stdout}"
+    )
+    positions = [found.index(phase) for phase in required_phases]
     assert positions == sorted(positions), f"Phases out of order. stdout:\n{stdout}"
 
 
 @pytest.mark.e2e
 @pytest.mark.integration
 @pytest.mark.skipif(not SUPPORTED_RUNTIME, reason="app main() supports Python 3.10-3.12")
+@pytest.mark.xdist_group(name="ffmpeg_serial")
 def test_mock_backend_mp3_end_to_end(tmp_path: Path):
     output_path = tmp_path / "mock-e2e.mp3"
     checkpoint_dir = Path(f"{output_path}.checkpoint")
@@ -58,8 +175,7 @@ def test_mock_backend_mp3_end_to_end(tmp_path: Path):
     assert result.returncode == 0, result.stderr
     assert_phase_order(result.stdout)
 
-    assert output_path.exists()
-    assert output_path.stat().st_size > 0
+    assert_nonempty_file(output_path)
 
     assert "CHECKPOINT:SAVED:" in result.stdout
     assert "CHECKPOINT:CLEANED" in result.stdout
@@ -69,7 +185,8 @@ def test_mock_backend_mp3_end_to_end(tmp_path: Path):
 @pytest.mark.e2e
 @pytest.mark.integration
 @pytest.mark.skipif(not SUPPORTED_RUNTIME, reason="app main() supports Python 3.10-3.12")
-def test_mock_backend_mp3_overlap3_end_to_end(tmp_path: Path):
+@pytest.mark.xdist_group(name="ffmpeg_serial")
+def test_mock_backend_mp3_overlap3_end_to_end(tmp_path: Path, cached_epub_parse):
     output_path = tmp_path / "mock-overlap3.mp3"
 
     result = run_app([
@@ -83,17 +200,21 @@ def test_mock_backend_mp3_overlap3_end_to_end(tmp_path: Path):
     assert result.returncode == 0, result.stderr
     assert_phase_order(result.stdout)
 
-    assert output_path.exists()
-    assert output_path.stat().st_size > 0
+    assert_nonempty_file(output_path)
     assert "PROGRESS:" in result.stdout
 
 
 @pytest.mark.e2e
 @pytest.mark.integration
 @pytest.mark.skipif(not SUPPORTED_RUNTIME, reason="app main() supports Python 3.10-3.12")
-def test_mock_backend_m4b_end_to_end_with_ffprobe(tmp_path: Path):
-    if shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None:
-        pytest.skip("ffmpeg/ffprobe not available")
+@pytest.mark.xdist_group(name="ffmpeg_serial")
+def test_mock_backend_m4b_end_to_end_with_ffprobe(
+    tmp_path: Path, cached_epub_parse, ffmpeg_paths
+):
+    if not ffmpeg_paths["ffmpeg"]:
+        pytest.skip("ffmpeg not available")
+    if av is None and not ffmpeg_paths["ffprobe"]:
+        pytest.skip("neither PyAV nor ffprobe is available")
 
     output_path = tmp_path / "mock-e2e.m4b"
     cover_path = ROOT_DIR / "photo.png"
@@ -113,28 +234,9 @@ def test_mock_backend_m4b_end_to_end_with_ffprobe(tmp_path: Path):
     assert result.returncode == 0, result.stderr
     assert_phase_order(result.stdout)
 
-    assert output_path.exists()
-    assert output_path.stat().st_size > 0
+    assert_nonempty_file(output_path)
 
-    ffprobe = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_streams",
-            "-show_chapters",
-            "-show_format",
-            str(output_path),
-        ],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    assert ffprobe.returncode == 0, ffprobe.stderr
-
-    probe_data = json.loads(ffprobe.stdout)
+    probe_data = probe_media(output_path, ffmpeg_paths["ffprobe"])
     chapters = probe_data.get("chapters", [])
     assert len(chapters) >= 1
     assert probe_data.get("format", {}).get("tags", {}).get("title") == "CLI Title"
@@ -152,20 +254,19 @@ def test_mock_backend_m4b_end_to_end_with_ffprobe(tmp_path: Path):
 @pytest.mark.e2e
 @pytest.mark.integration
 @pytest.mark.skipif(not SUPPORTED_RUNTIME, reason="app main() supports Python 3.10-3.12")
-def test_resume_after_failed_export_uses_checkpoint(tmp_path: Path):
+@pytest.mark.xdist_group(name="ffmpeg_serial")
+def test_resume_after_failed_export_uses_checkpoint(tmp_path: Path, cached_epub_parse):
     output_path = tmp_path / "resume-e2e.mp3"
     checkpoint_dir = Path(f"{output_path}.checkpoint")
 
-    failing_env = os.environ.copy()
-    failing_env["PATH"] = ""
-
-    first = run_app([
-        "--input", str(SAMPLE_EPUB),
-        "--output", str(output_path),
-        "--backend", "mock",
-        "--chunk_chars", "80",
-        "--checkpoint",
-    ], env=failing_env)
+    with patch("app.shutil.which", return_value=None):
+        first = run_app([
+            "--input", str(SAMPLE_EPUB),
+            "--output", str(output_path),
+            "--backend", "mock",
+            "--chunk_chars", "80",
+            "--checkpoint",
+        ])
 
     assert first.returncode != 0
     assert "ffmpeg not found" in first.stderr.lower()
@@ -182,8 +283,7 @@ def test_resume_after_failed_export_uses_checkpoint(tmp_path: Path):
     assert second.returncode == 0, second.stderr
     assert "CHECKPOINT:RESUMING:" in second.stdout
     assert "CHECKPOINT:CLEANED" in second.stdout
-    assert output_path.exists()
-    assert output_path.stat().st_size > 0
+    assert_nonempty_file(output_path)
     assert not checkpoint_dir.exists()
 
 
@@ -226,3 +326,17 @@ def test_failure_paths_report_actionable_errors(
         or "zip" in invalid.stderr.lower()
         or "epub" in invalid.stderr.lower()
     )
+
+
+@pytest.mark.e2e
+@pytest.mark.integration
+@pytest.mark.skipif(not SUPPORTED_RUNTIME, reason="app main() supports Python 3.10-3.12")
+def test_subprocess_exits_nonzero_with_error_on_stderr(tmp_path: Path):
+    result = run_app_subprocess([
+        "--input", str(tmp_path / "missing.epub"),
+        "--output", str(tmp_path / "out.mp3"),
+        "--backend", "mock",
+    ])
+
+    assert result.returncode != 0
+    assert "Input EPUB not found" in result.stderr
@@ -1,87 +1,77 @@
 """Integration tests for the IPC protocol messages."""
 
+import re
+
 import pytest
-import sys
-import io
-from pathlib import Path
-from contextlib import redirect_stdout
-from unittest.mock import patch, MagicMock
 
-import numpy as np
+from app import EventEmitter, format_text_event
+
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_IPC_RE = re.compile(
+    r"^(?:PHASE|METADATA|WORKER|TIMING|HEARTBEAT|PROGRESS|PARSE_PROGRESS):"
+)
 
 
 @pytest.mark.integration
 class TestIPCProtocol:
-    """Test IPC protocol message output."""
-
-    def test_phase_parsing_message(self, capsys):
-        """PHASE:PARSING should be emitted before text extraction."""
-        print("PHASE:PARSING", flush=True)
-        captured = capsys.readouterr()
-        assert "PHASE:PARSING" in captured.out
-
-    def test_phase_inference_message(self, capsys):
-        """PHASE:INFERENCE should be emitted before inference."""
-        print("PHASE:INFERENCE", flush=True)
-        captured = capsys.readouterr()
-        assert "PHASE:INFERENCE" in captured.out
-
-    def test_phase_concatenating_message(self, capsys):
-        """PHASE:CONCATENATING should be emitted before concatenation."""
-        print("PHASE:CONCATENATING", flush=True)
-        captured = capsys.readouterr()
-        assert "PHASE:CONCATENATING" in captured.out
-
-    def test_phase_exporting_message(self, capsys):
-        """PHASE:EXPORTING should be emitted before MP3 export."""
-        print("PHASE:EXPORTING", flush=True)
-        captured = capsys.readouterr()
-        assert "PHASE:EXPORTING" in captured.out
-
-    def test_metadata_total_chars_format(self, capsys):
-        """METADATA:total_chars:N should have correct format."""
-        total_chars = 12345
-        print(f"METADATA:total_chars:{total_chars}", flush=True)
-        captured = capsys.readouterr()
-        assert "METADATA:total_chars:12345" in captured.out
-
-    def test_worker_status_format(self, capsys):
-        """WORKER:id:status:details should have correct format."""
-        print("WORKER:0:INFER:Chunk 5/50", flush=True)
-        captured = capsys.readouterr()
-        assert "WORKER:0:INFER:Chunk 5/50" in captured.out
+    """Test IPC protocol message formatting."""
+
+    @pytest.mark.parametrize(
+        "event_type, payload, expected",
+        [
+            ("phase", {"phase": "PARSING"}, "PHASE:PARSING"),
+            ("phase", {"phase": "INFERENCE"}, "PHASE:INFERENCE"),
+            ("phase", {"phase": "CONCATENATING"}, "PHASE:CONCATENATING"),
+            ("phase", {"phase": "EXPORTING"}, "PHASE:EXPORTING"),
+            (
+                "metadata",
+                {"key": "total_chars", "value": 12345},
+                "METADATA:total_chars:12345",
+            ),
+            (
+                "worker",
+                {"id": 0, "status": "INFER", "details": "Chunk 5/50"},
+                "WORKER:0:INFER:Chunk 5/50",
+            ),
+            ("timing", {"chunk_idx": 5, "chunk_timing_ms": 2340}, "TIMING:5:2340"),
+            ("heartbeat", {"heartbeat_ts": 1700000000123}, "HEARTBEAT:1700000000123"),
+            (
+                "progress",
+                {"current_chunk": 42, "total_chunks": 100},
+                "PROGRESS:42/100 chunks",
+            ),
+            (
+                "parse_progress",
+                {"current_item": 4, "total_items": 12, "current_chapter_count": 3},
+                "PARSE_PROGRESS:4/12:3",
+            ),
+        ],
+    )
+    def test_message_format(self, event_type, payload, expected):
+        """Each event type should render to its documented IPC line."""
+        assert format_text_event(event_type, payload) == expected
+
+    def test_unknown_event_has_no_text_form(self):
+        """Event types without a legacy text form should render as None."""
+        assert format_text_event("log", {"message": "hello"}) is None
 
-    def test_timing_format(self, capsys):
-        """TIMING:chunk_idx:ms should have correct format."""
-        print("TIMING:5:2340", flush=True)
-        captured = capsys.readouterr()
-        assert "TIMING:5:2340" in captured.out
-
-    def test_heartbeat_format(self, capsys):
-        """HEARTBEAT:timestamp should have correct format."""
-        import time
-        ts = int(time.time() * 1000)
-        print(f"HEARTBEAT:{ts}", flush=True)
-        captured = capsys.readouterr()
-        assert f"HEARTBEAT:{ts}" in captured.out
-
-    def test_progress_format(self, capsys):
-        """PROGRESS:N/M chunks should have correct format."""
-        print("PROGRESS:42/100 chunks", flush=True)
-        captured = capsys.readouterr()
-        assert "PROGRESS:42/100 chunks" in captured.out
+    def test_ipc_message_sequence(self, capsys):
+        """Messages should reach stdout in emission order."""
+        events = EventEmitter(event_format="text")
+        events.emit("phase", phase="PARSING")
+        events.emit("parse_progress", current_item=1, total_items=2, current_chapter_count=1)
+        events.emit("metadata", key="total_chars", value=5000)
+        events.emit("phase", phase="INFERENCE")
+        events.emit("worker", id=0, status="INFER", details="Chunk 1/10")
+        events.emit("timing", chunk_idx=0, chunk_timing_ms=1500)
+        events.emit("heartbeat", heartbeat_ts=1234567890)
+        events.emit("progress", current_chunk=1, total_chunks=10)
+        events.emit("phase", phase="CONCATENATING")
+        events.emit("phase", phase="EXPORTING")
 
-    def test_parse_progress_format(self, capsys):
-        """PARSE_PROGRESS:N/M:C should have correct format."""
-        print("PARSE_PROGRESS:4/12:3", flush=True)
         captured = capsys.readouterr()
-        assert "PARSE_PROGRESS:4/12:3" in captured.out
 
-    def test_ipc_message_sequence(self, capsys):
-        """Messages should appear in correct sequence."""
-        messages = [
+        assert captured.out.splitlines() == [
             "PHASE:PARSING",
             "PARSE_PROGRESS:1/2:1",
             "METADATA:total_chars:5000",
@@ -94,21 +84,6 @@ class TestIPCProtocol:
             "PHASE:EXPORTING",
         ]
 
-        for msg in messages:
-            print(msg, flush=True)
-
-        captured = capsys.readouterr()
-
-        # Verify all messages present
-        for msg in messages:
-            assert msg in captured.out
-
-        # Verify order (each message should come before the next)
-        for i in range(len(messages) - 1):
-            pos_current = captured.out.find(messages[i])
-            pos_next = captured.out.find(messages[i + 1])
-            assert pos_current < pos_next, f"{messages[i]} should come before {messages[i+1]}"
-
 
 @pytest.mark.integration
 class TestIPCProtocolParsing:
@@ -155,7 +130,6 @@ class TestIPCProtocolParsing:
     def test_parse_progress_message(self):
         """Should parse PROGRESS:N/M chunks messages."""
         line = "PROGRESS:42/100 chunks"
-        import re
         match = re.match(r"PROGRESS:(\d+)/(\d+)\s*chunks", line)
         assert match is not None
         current = int(match.group(1))
@@ -166,7 +140,6 @@ class TestIPCProtocolParsing:
     def test_parse_parse_progress_message(self):
         """Should parse PARSE_PROGRESS:N/M:C messages."""
         line = "PARSE_PROGRESS:4/12:3"
-        import re
         match = re.match(r"PARSE_PROGRESS:(\d+)/(\d+):(\d+)", line)
         assert match is not None
         current = int(match.group(1))
@@ -192,13 +165,9 @@ PROGRESS:1/10 chunks
         """
 
         lines = output.strip().split("\n")
-        ipc_messages = []
-
-        for line in lines:
-            line = line.strip()
-            if any(line.startswith(prefix) for prefix in
-                   ["PHASE:", "METADATA:", "WORKER:", "TIMING:", "HEARTBEAT:", "PROGRESS:", "PARSE_PROGRESS:"]):
-                ipc_messages.append(line)
+        ipc_messages = [
+            line for line in (raw.strip() for raw in lines) if _IPC_RE.match(line)
+        ]
 
         assert len(ipc_messages) == 7
         assert ipc_messages[0] == "PHASE:PARSING"
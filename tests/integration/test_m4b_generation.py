@@ -1,18 +1,14 @@
 """Integration tests for M4B audiobook generation."""
 
 import pytest
-import sys
 import os
 import subprocess
 import tempfile
 import json
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import (
     extract_epub_metadata,
     extract_epub_text,
@@ -199,6 +195,7 @@ class TestM4BEndToEnd:
         return shutil.which("ffmpeg") is not None
 
     @pytest.mark.slow
+    @pytest.mark.xdist_group(name="ffmpeg_serial")
     def test_real_m4b_creation(self, temp_dir, has_ffmpeg):
         """Create an actual M4B file and verify with ffprobe."""
         if not has_ffmpeg:
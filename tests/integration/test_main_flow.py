@@ -1,20 +1,17 @@
 """Integration tests for the main processing flow."""
 
 import pytest
-import sys
 import os
 import tempfile
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import (
     extract_epub_text,
     split_text_to_chunks,
     audio_to_int16,
+    concat_and_convert_to_int16,
     export_pcm_to_mp3,
 )
 
@@ -40,7 +37,7 @@ class TestMainFlow:
             assert len(chunk.text) > 0
             assert chunk.chapter_title is not None
 
-    def test_audio_processing_flow(self, temp_dir, mock_ffmpeg):
+    def test_audio_processing_flow(self, temp_dir, mock_ffmpeg_stream):
         """Test audio conversion to MP3 export flow."""
         # Simulate TTS output (float audio)
         audio_segments = [
@@ -48,23 +45,21 @@ class TestMainFlow:
             for _ in range(3)
         ]
 
-        # Convert to int16
-        int16_segments = [audio_to_int16(seg) for seg in audio_segments]
-
-        # Verify conversion
-        for seg in int16_segments:
-            assert seg.dtype == np.int16
+        # Convert and concatenate in one pass
+        combined = concat_and_convert_to_int16(audio_segments)
 
-        # Concatenate
-        combined = np.concatenate(int16_segments)
+        assert combined.dtype == np.int16
         assert len(combined) == 24000 * 3
+        np.testing.assert_array_equal(
+            combined, np.concatenate([audio_to_int16(seg) for seg in audio_segments])
+        )
 
         # Export
         output_path = f"{temp_dir}/test.mp3"
         export_pcm_to_mp3(combined, output_path)
 
         # Verify ffmpeg was called
-        mock_ffmpeg.assert_called_once()
+        mock_ffmpeg_stream.assert_called_once()
 
     def test_handles_missing_input(self, temp_dir):
         """Should handle missing input file gracefully."""
@@ -74,7 +69,7 @@ class TestMainFlow:
             # This should raise an error
             extract_epub_text(nonexistent)
 
-    def test_creates_output_directory(self, temp_dir, mock_ffmpeg):
+    def test_creates_output_directory(self, temp_dir, mock_ffmpeg_stream):
         """Should create output directory if it doesn't exist."""
         # Create nested path that doesn't exist
         nested_output = f"{temp_dir}/new/nested/dir/output.mp3"
@@ -89,15 +84,14 @@ class TestMainFlow:
         audio = np.array([0, 1000, -1000], dtype=np.int16)
         export_pcm_to_mp3(audio, nested_output)
 
-        mock_ffmpeg.assert_called_once()
+        mock_ffmpeg_stream.assert_called_once()
 
-    def test_empty_epub_handling(self, temp_dir):
+    def test_empty_epub_handling(self):
         """Should handle EPUB with no text content."""
-        # Create minimal empty EPUB
+        # Build a minimal empty EPUB entirely in memory
+        import io
         import zipfile
 
-        epub_path = f"{temp_dir}/empty.epub"
-
         mimetype = "application/epub+zip"
         container_xml = """<?xml version="1.0"?>
         <container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
@@ -126,15 +120,17 @@ class TestMainFlow:
         <body></body>
         </html>"""
 
-        with zipfile.ZipFile(epub_path, 'w') as epub:
+        epub_buffer = io.BytesIO()
+        with zipfile.ZipFile(epub_buffer, 'w') as epub:
             epub.writestr('mimetype', mimetype, compress_type=zipfile.ZIP_STORED)
             epub.writestr('META-INF/container.xml', container_xml)
             epub.writestr('OEBPS/content.opf', content_opf)
             epub.writestr('OEBPS/empty.xhtml', empty_xhtml)
+        epub_buffer.seek(0)
 
         # Should raise ValueError for empty content
         with pytest.raises(ValueError) as excinfo:
-            extract_epub_text(epub_path)
+            extract_epub_text(epub_buffer)
 
         assert "No readable text" in str(excinfo.value)
 
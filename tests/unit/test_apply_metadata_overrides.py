@@ -1,13 +1,9 @@
 """Tests for apply_metadata_overrides."""
 
 import argparse
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import apply_metadata_overrides, BookMetadata
 
 
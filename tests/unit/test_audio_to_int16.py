@@ -1,14 +1,15 @@
 """Tests for the audio_to_int16 function."""
 
 import pytest
-import sys
-from pathlib import Path
 
 import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from app import audio_to_int16, concat_and_convert_to_int16
 
-from app import audio_to_int16
+try:
+    import torch
+except ImportError:
+    torch = None
 
 
 @pytest.mark.unit
@@ -78,26 +79,24 @@ class TestAudioToInt16:
         assert result[0] == 16383
         assert result[1] == -16383
 
+    def test_input_array_is_not_modified(self):
+        """Conversion should not clip or scale the caller's array in place."""
+        audio = np.array([2.0, -0.25, -3.0], dtype=np.float32)
+        original = audio.copy()
+
+        result = audio_to_int16(audio)
+
+        np.testing.assert_array_equal(audio, original)
+        np.testing.assert_array_equal(result, [32767, -8191, -32767])
+
 
 @pytest.mark.unit
+@pytest.mark.skipif(torch is None, reason="torch not available")
 class TestAudioToInt16WithTorch:
     """Test cases for audio_to_int16 with torch tensors."""
 
-    @pytest.fixture
-    def torch_available(self):
-        """Check if torch is available."""
-        try:
-            import torch
-            return True
-        except ImportError:
-            return False
-
-    def test_torch_tensor_cpu(self, torch_available):
+    def test_torch_tensor_cpu(self):
         """Torch CPU tensor should be converted."""
-        if not torch_available:
-            pytest.skip("torch not available")
-
-        import torch
         audio = torch.tensor([0.5, -0.5, 1.0, -1.0], dtype=torch.float32)
         result = audio_to_int16(audio)
 
@@ -107,14 +106,53 @@ class TestAudioToInt16WithTorch:
         assert result[2] == 32767
         assert result[3] == -32767
 
-    def test_torch_tensor_detached(self, torch_available):
+    def test_torch_tensor_detached(self):
         """Torch tensor with grad should be detached."""
-        if not torch_available:
-            pytest.skip("torch not available")
-
-        import torch
         audio = torch.tensor([0.5, -0.5], dtype=torch.float32, requires_grad=True)
         result = audio_to_int16(audio)
 
         assert result.dtype == np.int16
         assert len(result) == 2
+
+    def test_torch_int16_tensor_passthrough(self):
+        """Int16 torch tensors should be returned without rescaling."""
+        audio = torch.tensor([0, 16383, -16383, 32767], dtype=torch.int16)
+        result = audio_to_int16(audio)
+
+        assert result.dtype == np.int16
+        np.testing.assert_array_equal(result, [0, 16383, -16383, 32767])
+
+    def test_torch_tensor_clipping_matches_numpy(self):
+        """On-device quantization should match the numpy conversion path."""
+        values = [0.0, 0.5, -0.5, 1.5, -2.0, 0.123456]
+        result = audio_to_int16(torch.tensor(values, dtype=torch.float32))
+        expected = audio_to_int16(np.array(values, dtype=np.float32))
+
+        np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.unit
+class TestConcatAndConvertToInt16:
+    """Test cases for concat_and_convert_to_int16."""
+
+    def test_matches_per_segment_conversion(self):
+        """Mixed float/int16 segments should match convert-then-concatenate."""
+        segments = [
+            np.array([0.5, -2.0], dtype=np.float32),
+            np.array([100, -100], dtype=np.int16),
+            np.array([1.5, -0.25, 0.0], dtype=np.float64),
+            [0.5],
+        ]
+
+        result = concat_and_convert_to_int16(segments)
+
+        expected = np.concatenate([audio_to_int16(seg) for seg in segments])
+        assert result.dtype == np.int16
+        np.testing.assert_array_equal(result, expected)
+
+    def test_empty_input(self):
+        """No segments should give an empty int16 array."""
+        result = concat_and_convert_to_int16([])
+
+        assert result.dtype == np.int16
+        assert len(result) == 0
@@ -1,25 +1,114 @@
 """Tests for checkpoint verification and resume spooling behavior."""
 
+import hashlib
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import main, TextChunk
-from checkpoint import CheckpointState, inspect_checkpoint, save_checkpoint, save_chunk_audio, verify_checkpoint
+import checkpoint
+from checkpoint import (
+    CheckpointState,
+    compute_epub_hash,
+    inspect_checkpoint,
+    load_checkpoint,
+    load_chunk_audio,
+    save_checkpoint,
+    save_chunk_audio,
+    verify_checkpoint,
+)
+
+
+DUMMY_EPUB_BYTES = b"dummy-epub"
+DUMMY_EPUB_HASH = hashlib.sha256(DUMMY_EPUB_BYTES).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def dummy_epub(tmp_path_factory):
+    """Placeholder EPUB shared by tests that only need a stable file hash."""
+    path = tmp_path_factory.mktemp("checkpoint") / "book.epub"
+    path.write_bytes(DUMMY_EPUB_BYTES)
+    return str(path)
 
 
 @pytest.mark.unit
-def test_verify_checkpoint_rejects_chunk_chars_mismatch(temp_dir):
-    epub_path = f"{temp_dir}/book.epub"
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_checkpoint_state_round_trips_with_and_without_orjson(temp_dir, monkeypatch, use_orjson):
+    if use_orjson and checkpoint.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(checkpoint, "orjson", None)
+
     checkpoint_dir = f"{temp_dir}/book.mp3.checkpoint"
+    state = CheckpointState(
+        epub_hash="abc123",
+        config={"voice": "af_heart", "speed": 1.25, "normalize": False, "cover": None},
+        total_chunks=3,
+        completed_chunks=[0, 2],
+        chapter_start_indices=[(0, "Chapter 1"), (2, "Kapitel \u00fcber")],
+    )
 
-    with open(epub_path, "wb") as f:
-        f.write(b"dummy-epub")
+    save_checkpoint(checkpoint_dir, state)
+
+    assert load_checkpoint(checkpoint_dir) == state
+
+
+@pytest.mark.unit
+def test_load_checkpoint_returns_none_for_corrupt_state(temp_dir):
+    checkpoint_dir = Path(temp_dir) / "book.mp3.checkpoint"
+    checkpoint_dir.mkdir()
+    (checkpoint_dir / "state.json").write_bytes(b"{not json")
+
+    assert load_checkpoint(str(checkpoint_dir)) is None
+
+
+@pytest.mark.unit
+def test_load_chunk_audio_memory_maps_saved_chunk(temp_dir):
+    save_chunk_audio(temp_dir, 0, np.array([1, -2, 3], dtype=np.int16))
+
+    audio = load_chunk_audio(temp_dir, 0)
+
+    assert isinstance(audio, np.memmap)
+    assert not audio.flags.writeable
+    np.testing.assert_array_equal(audio, [1, -2, 3])
+    assert load_chunk_audio(temp_dir, 1) is None
+
+
+@pytest.mark.unit
+def test_dummy_epub_hash_matches_compute_epub_hash(dummy_epub):
+    assert compute_epub_hash(dummy_epub) == DUMMY_EPUB_HASH
+
+
+@pytest.mark.unit
+def test_compute_epub_hash_is_memoized_until_file_changes(temp_dir, monkeypatch):
+    epub_path = f"{temp_dir}/book.epub"
+    Path(epub_path).write_bytes(b"first")
+    checkpoint._cached_epub_hash.cache_clear()
+    opened = []
+    real_open = open
+    monkeypatch.setattr(
+        "builtins.open",
+        lambda path, *args, **kwargs: opened.append(path) or real_open(path, *args, **kwargs),
+    )
+
+    first = compute_epub_hash(epub_path)
+    assert compute_epub_hash(epub_path) == first
+    assert len(opened) == 1
+
+    Path(epub_path).write_bytes(b"second version")
+    opened.clear()
+
+    assert compute_epub_hash(epub_path) == hashlib.sha256(b"second version").hexdigest()
+    assert len(opened) == 1
+
+
+@pytest.mark.unit
+def test_verify_checkpoint_rejects_chunk_chars_mismatch(temp_dir, dummy_epub):
+    epub_path = dummy_epub
+    checkpoint_dir = f"{temp_dir}/book.mp3.checkpoint"
 
     state = CheckpointState(
         epub_hash="",
@@ -35,10 +124,7 @@ def test_verify_checkpoint_rejects_chunk_chars_mismatch(temp_dir):
         chapter_start_indices=[(0, "Chapter 1")],
     )
 
-    # Fill hash after writing file
-    from checkpoint import compute_epub_hash
-
-    state.epub_hash = compute_epub_hash(epub_path)
+    state.epub_hash = DUMMY_EPUB_HASH
     save_checkpoint(checkpoint_dir, state)
 
     ok = verify_checkpoint(
@@ -56,13 +142,10 @@ def test_verify_checkpoint_rejects_chunk_chars_mismatch(temp_dir):
 
 
 @pytest.mark.unit
-def test_verify_checkpoint_rejects_split_pattern_mismatch(temp_dir):
-    epub_path = f"{temp_dir}/book.epub"
+def test_verify_checkpoint_rejects_split_pattern_mismatch(temp_dir, dummy_epub):
+    epub_path = dummy_epub
     checkpoint_dir = f"{temp_dir}/book.mp3.checkpoint"
 
-    with open(epub_path, "wb") as f:
-        f.write(b"dummy-epub")
-
     state = CheckpointState(
         epub_hash="",
         config={
@@ -81,9 +164,7 @@ def test_verify_checkpoint_rejects_split_pattern_mismatch(temp_dir):
         chapter_start_indices=[(0, "Chapter 1")],
     )
 
-    from checkpoint import compute_epub_hash
-
-    state.epub_hash = compute_epub_hash(epub_path)
+    state.epub_hash = DUMMY_EPUB_HASH
     save_checkpoint(checkpoint_dir, state)
 
     ok = verify_checkpoint(
@@ -105,17 +186,12 @@ def test_verify_checkpoint_rejects_split_pattern_mismatch(temp_dir):
 
 
 @pytest.mark.unit
-def test_inspect_checkpoint_reports_reason_for_chunk_mismatch(temp_dir):
-    epub_path = f"{temp_dir}/book.epub"
+def test_inspect_checkpoint_reports_reason_for_chunk_mismatch(temp_dir, dummy_epub):
+    epub_path = dummy_epub
     checkpoint_dir = f"{temp_dir}/book.mp3.checkpoint"
 
-    with open(epub_path, "wb") as f:
-        f.write(b"dummy-epub")
-
-    from checkpoint import compute_epub_hash
-
     state = CheckpointState(
-        epub_hash=compute_epub_hash(epub_path),
+        epub_hash=DUMMY_EPUB_HASH,
         config={
             "voice": "af_heart",
             "speed": 1.0,
@@ -146,17 +222,12 @@ def test_inspect_checkpoint_reports_reason_for_chunk_mismatch(temp_dir):
 
 
 @pytest.mark.unit
-def test_inspect_checkpoint_counts_missing_audio_chunks_as_regeneratable(temp_dir):
-    epub_path = f"{temp_dir}/book.epub"
+def test_inspect_checkpoint_counts_missing_audio_chunks_as_regeneratable(temp_dir, dummy_epub):
+    epub_path = dummy_epub
     checkpoint_dir = f"{temp_dir}/book.mp3.checkpoint"
 
-    with open(epub_path, "wb") as f:
-        f.write(b"dummy-epub")
-
-    from checkpoint import compute_epub_hash
-
     state = CheckpointState(
-        epub_hash=compute_epub_hash(epub_path),
+        epub_hash=DUMMY_EPUB_HASH,
         config={
             "voice": "af_heart",
             "speed": 1.0,
@@ -189,7 +260,7 @@ def test_inspect_checkpoint_counts_missing_audio_chunks_as_regeneratable(temp_di
 
 
 @pytest.mark.unit
-def test_resume_reuses_saved_chunk_audio_in_order(temp_dir):
+def test_resume_reuses_saved_chunk_audio_in_order(temp_dir, mocker):
     epub_path = f"{temp_dir}/book.epub"
     output_path = f"{temp_dir}/book.mp3"
 
@@ -214,8 +285,17 @@ def test_resume_reuses_saved_chunk_audio_in_order(temp_dir):
     backend.name = "pytorch"
     backend.sample_rate = 24000
     backend.generate.return_value = []
+    spooled = []
+    parsed = type(
+        "Parsed",
+        (),
+        {
+            "metadata": None,
+            "chapters": [("Chapter 1", "Hello world")],
+        },
+    )()
 
-    with patch("sys.argv", [
+    mocker.patch.object(sys, "argv", [
         "app.py",
         "--input", epub_path,
         "--output", output_path,
@@ -223,28 +303,31 @@ def test_resume_reuses_saved_chunk_audio_in_order(temp_dir):
         "--resume",
         "--checkpoint",
         "--no_rich",
-    ]):
-        with patch("app.verify_checkpoint", return_value=True):
-            with patch("app.load_checkpoint", return_value=checkpoint_state):
-                with patch(
-                    "app.parse_epub",
-                    return_value=type(
-                        "Parsed",
-                        (),
-                        {
-                            "metadata": None,
-                            "chapters": [("Chapter 1", "Hello world")],
-                        },
-                    )(),
-                ):
-                    with patch("app.split_text_to_chunks", return_value=([TextChunk("Chapter 1", "Hello world")], [(0, "Chapter 1")])):
-                        with patch("app.create_backend", return_value=backend):
-                            with patch("app.load_chunk_audio", return_value=np.array([1, 2, 3], dtype=np.int16)) as mock_load_chunk:
-                                with patch("app.export_pcm_file_to_mp3") as mock_export:
-                                    with patch("app.save_checkpoint"):
-                                        with patch("app.cleanup_checkpoint"):
-                                            with patch("app.sys.version_info", (3, 12, 0)):
-                                                main()
-
-    mock_load_chunk.assert_called_once()
-    mock_export.assert_called_once()
+    ])
+    mocker.patch.object(sys, "version_info", (3, 12, 0))
+    mocks = mocker.patch.multiple(
+        "app",
+        verify_checkpoint=mocker.MagicMock(return_value=True),
+        load_checkpoint=mocker.MagicMock(return_value=checkpoint_state),
+        parse_epub=mocker.MagicMock(return_value=parsed),
+        split_text_to_chunks=mocker.MagicMock(
+            return_value=([TextChunk("Chapter 1", "Hello world")], [(0, "Chapter 1")])
+        ),
+        create_backend=mocker.MagicMock(return_value=backend),
+        load_chunk_audio=mocker.DEFAULT,
+        export_pcm_file_to_mp3=mocker.DEFAULT,
+        save_checkpoint=mocker.DEFAULT,
+        cleanup_checkpoint=mocker.DEFAULT,
+    )
+    mocks["load_chunk_audio"].return_value = np.array([1, 2, 3], dtype=np.int16)
+    mocks["export_pcm_file_to_mp3"].side_effect = (
+        lambda spool_path, *args, **kwargs: spooled.append(
+            np.fromfile(spool_path, dtype=np.int16)
+        )
+    )
+
+    main()
+
+    mocks["load_chunk_audio"].assert_called_once()
+    mocks["export_pcm_file_to_mp3"].assert_called_once()
+    np.testing.assert_array_equal(spooled[0], [1, 2, 3])
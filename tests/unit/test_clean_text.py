@@ -1,10 +1,6 @@
 """Tests for the _clean_text function."""
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app import _clean_text
 
@@ -64,3 +60,8 @@ class TestCleanText:
         """Punctuation should be preserved."""
         assert _clean_text("Hello,   world!") == "Hello, world!"
         assert _clean_text("End.\n\nStart.") == "End. Start."
+
+    def test_unicode_whitespace_collapsed(self):
+        """Non-ASCII whitespace such as NBSP and em space should collapse too."""
+        assert _clean_text("a\u00a0\u00a0b\u2003c\u3000") == "a b c"
+        assert _clean_text("zero\u200bwidth") == "zero\u200bwidth"
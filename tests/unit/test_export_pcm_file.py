@@ -1,17 +1,16 @@
 """Tests for file-based PCM export helpers."""
 
-import sys
-from pathlib import Path
+import wave
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import (
     export_pcm_file_to_m4b,
     export_pcm_file_to_mp3,
+    export_pcm_file_to_wav,
+    export_pcm_file_with_soundfile,
     BookMetadata,
     ChapterInfo,
 )
@@ -167,3 +166,111 @@ class TestExportPcmFile:
                 mock_run.return_value = MagicMock(returncode=1, stderr=b"boom")
                 with pytest.raises(RuntimeError, match="ffmpeg failed: boom"):
                     export_pcm_file_to_m4b(pcm_path, output_path, metadata, [])
+
+    def test_wav_export_writes_header_without_ffmpeg(self, temp_dir):
+        pcm_path = f"{temp_dir}/input.pcm"
+        output_path = f"{temp_dir}/output.wav"
+        pcm = np.array([0, 16383, -16383, 32767], dtype=np.int16)
+        with open(pcm_path, "wb") as f:
+            f.write(pcm.tobytes())
+
+        with patch("subprocess.run") as mock_run:
+            export_pcm_file_to_wav(pcm_path, output_path, sample_rate=22050)
+
+        mock_run.assert_not_called()
+        with wave.open(output_path, "rb") as wav_file:
+            assert wav_file.getnchannels() == 1
+            assert wav_file.getsampwidth() == 2
+            assert wav_file.getframerate() == 22050
+            frames = wav_file.readframes(wav_file.getnframes())
+        np.testing.assert_array_equal(np.frombuffer(frames, dtype=np.int16), pcm)
+
+    def test_wav_export_empty_spool_writes_short_silence(self, temp_dir):
+        output_path = f"{temp_dir}/output.wav"
+
+        export_pcm_file_to_wav(f"{temp_dir}/missing.pcm", output_path)
+
+        with wave.open(output_path, "rb") as wav_file:
+            assert wav_file.getnframes() == 2400
+            frames = wav_file.readframes(wav_file.getnframes())
+        assert not np.frombuffer(frames, dtype=np.int16).any()
+
+    def test_wav_export_normalize_scales_peak_to_headroom(self, temp_dir):
+        pcm_path = f"{temp_dir}/input.pcm"
+        output_path = f"{temp_dir}/output.wav"
+        with open(pcm_path, "wb") as f:
+            f.write(np.array([0, 1000, -4000, 2000], dtype=np.int16).tobytes())
+
+        export_pcm_file_to_wav(pcm_path, output_path, normalize=True)
+
+        with wave.open(output_path, "rb") as wav_file:
+            frames = wav_file.readframes(wav_file.getnframes())
+        samples = np.frombuffer(frames, dtype=np.int16)
+        target_peak = round(32767 * 10 ** (-1 / 20))
+        assert abs(int(samples[2])) == target_peak
+        assert samples[0] == 0
+        assert samples[1] == round(1000 * target_peak / 4000)
+
+    def test_wav_export_normalize_handles_full_scale_negative_peak(self, temp_dir):
+        pcm_path = f"{temp_dir}/input.pcm"
+        output_path = f"{temp_dir}/output.wav"
+        with open(pcm_path, "wb") as f:
+            f.write(np.array([-32768, 100], dtype=np.int16).tobytes())
+
+        export_pcm_file_to_wav(pcm_path, output_path, normalize=True)
+
+        with wave.open(output_path, "rb") as wav_file:
+            samples = np.frombuffer(wav_file.readframes(2), dtype=np.int16)
+        assert -32768 < samples[0] < -29000
+
+    @pytest.mark.parametrize(
+        "output_format,container,subtype",
+        [("flac", "FLAC", "PCM_16"), ("ogg", "OGG", "VORBIS")],
+    )
+    def test_soundfile_export_streams_spool_without_ffmpeg(
+        self, temp_dir, output_format, container, subtype
+    ):
+        pcm_path = f"{temp_dir}/input.pcm"
+        output_path = f"{temp_dir}/output.{output_format}"
+        pcm = np.array([0, 16383, -16383], dtype=np.int16)
+        with open(pcm_path, "wb") as f:
+            f.write(pcm.tobytes())
+
+        with patch("audiobook_backend.export.soundfile") as mock_soundfile:
+            with patch("audiobook_backend.export.subprocess.run") as mock_run:
+                export_pcm_file_with_soundfile(
+                    pcm_path, output_path, output_format, sample_rate=22050
+                )
+
+        mock_run.assert_not_called()
+        mock_soundfile.SoundFile.assert_called_once_with(
+            output_path,
+            mode="w",
+            samplerate=22050,
+            channels=1,
+            format=container,
+            subtype=subtype,
+        )
+        sound_file = mock_soundfile.SoundFile.return_value.__enter__.return_value
+        written = np.concatenate([c.args[0] for c in sound_file.write.call_args_list])
+        np.testing.assert_array_equal(written, pcm)
+
+    def test_soundfile_export_empty_spool_writes_short_silence(self, temp_dir):
+        pcm_path = f"{temp_dir}/empty.pcm"
+        open(pcm_path, "wb").close()
+
+        with patch("audiobook_backend.export.soundfile") as mock_soundfile:
+            export_pcm_file_with_soundfile(pcm_path, f"{temp_dir}/out.flac", "flac")
+
+        sound_file = mock_soundfile.SoundFile.return_value.__enter__.return_value
+        silence = sound_file.write.call_args.args[0]
+        assert silence.dtype == np.int16
+        assert len(silence) == 2400
+        assert not silence.any()
+
+    def test_soundfile_export_raises_when_soundfile_missing(self, temp_dir):
+        with patch("audiobook_backend.export.soundfile", None):
+            with pytest.raises(RuntimeError, match="requires soundfile"):
+                export_pcm_file_with_soundfile(
+                    f"{temp_dir}/input.pcm", f"{temp_dir}/out.ogg", "ogg"
+                )
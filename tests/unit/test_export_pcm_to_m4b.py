@@ -1,15 +1,11 @@
 """Tests for the export_pcm_to_m4b function."""
 
-import sys
 import os
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import numpy as np
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import export_pcm_to_m4b, BookMetadata, ChapterInfo
 
 
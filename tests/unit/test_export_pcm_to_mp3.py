@@ -1,23 +1,25 @@
 """Tests for the export_pcm_to_mp3 function."""
 
 import pytest
-import sys
 import subprocess
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app import export_pcm_to_mp3, DEFAULT_SAMPLE_RATE
+from audiobook_backend.export import FFMPEG_PIPE_SIZE, _find_ffmpeg
+
+
+def written_bytes(proc):
+    """Concatenate everything written to a mocked ffmpeg stdin."""
+    return b"".join(bytes(call.args[0]) for call in proc.stdin.write.call_args_list)
 
 
 @pytest.mark.unit
 class TestExportPcmToMp3:
     """Test cases for export_pcm_to_mp3 function."""
 
-    def test_valid_pcm_export(self, temp_dir, mock_ffmpeg):
+    def test_valid_pcm_export(self, temp_dir, mock_ffmpeg_stream):
         """Valid PCM data should be exported successfully."""
         pcm_data = np.array([0, 16383, -16383, 32767, -32767], dtype=np.int16)
         output_path = f"{temp_dir}/output.mp3"
@@ -25,8 +27,8 @@ class TestExportPcmToMp3:
         export_pcm_to_mp3(pcm_data, output_path)
 
         # Verify ffmpeg was called
-        mock_ffmpeg.assert_called_once()
-        call_args = mock_ffmpeg.call_args
+        mock_ffmpeg_stream.assert_called_once()
+        call_args = mock_ffmpeg_stream.call_args
 
         # Check command arguments
         cmd = call_args[0][0]
@@ -59,27 +61,43 @@ class TestExportPcmToMp3:
                 export_pcm_to_mp3(pcm_data, output_path)
 
             assert "ffmpeg not found" in str(excinfo.value)
+            # A failed lookup is not cached
+            assert _find_ffmpeg.cache_info().currsize == 0
 
-    def test_ffmpeg_failure(self, temp_dir):
-        """Should raise RuntimeError if ffmpeg fails."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/ffmpeg"
+    def test_ffmpeg_lookup_is_cached(self, temp_dir, mock_ffmpeg_stream):
+        """Repeated exports should resolve ffmpeg on PATH only once."""
+        pcm_data = np.array([0, 1000], dtype=np.int16)
 
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=1,
-                    stderr=b"Error: something went wrong"
-                )
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg") as mock_which:
+            export_pcm_to_mp3(pcm_data, f"{temp_dir}/a.mp3")
+            export_pcm_to_mp3(pcm_data, f"{temp_dir}/b.mp3")
 
-                pcm_data = np.array([0, 1000], dtype=np.int16)
-                output_path = f"{temp_dir}/output.mp3"
+        mock_which.assert_called_once_with("ffmpeg")
+        assert _find_ffmpeg.cache_info().currsize == 1
+
+    def test_ffmpeg_failure(self, temp_dir, mock_ffmpeg_stream):
+        """Should raise RuntimeError with ffmpeg's stderr log if ffmpeg fails."""
+        proc = mock_ffmpeg_stream.return_value
+        proc.wait.return_value = 1
+
+        def fake_popen(cmd, **kwargs):
+            # ffmpeg writes its log into the temp file, not a PIPE
+            assert kwargs["stderr"] is not subprocess.PIPE
+            kwargs["stderr"].write(b"Error: something went wrong")
+            return proc
+
+        mock_ffmpeg_stream.side_effect = fake_popen
+
+        pcm_data = np.array([0, 1000], dtype=np.int16)
+        output_path = f"{temp_dir}/output.mp3"
 
-                with pytest.raises(RuntimeError) as excinfo:
-                    export_pcm_to_mp3(pcm_data, output_path)
+        with pytest.raises(RuntimeError) as excinfo:
+            export_pcm_to_mp3(pcm_data, output_path)
 
-                assert "ffmpeg failed" in str(excinfo.value)
+        assert "ffmpeg failed" in str(excinfo.value)
+        assert "something went wrong" in str(excinfo.value)
 
-    def test_custom_sample_rate(self, temp_dir, mock_ffmpeg):
+    def test_custom_sample_rate(self, temp_dir, mock_ffmpeg_stream):
         """Custom sample rate should be passed to ffmpeg."""
         pcm_data = np.array([0, 1000], dtype=np.int16)
         output_path = f"{temp_dir}/output.mp3"
@@ -87,41 +105,115 @@ class TestExportPcmToMp3:
 
         export_pcm_to_mp3(pcm_data, output_path, sample_rate=custom_rate)
 
-        call_args = mock_ffmpeg.call_args
+        call_args = mock_ffmpeg_stream.call_args
         cmd = call_args[0][0]
         assert str(custom_rate) in cmd
 
-    def test_custom_bitrate(self, temp_dir, mock_ffmpeg):
+    def test_custom_bitrate(self, temp_dir, mock_ffmpeg_stream):
         """Custom bitrate should be passed to ffmpeg."""
         pcm_data = np.array([0, 1000], dtype=np.int16)
         output_path = f"{temp_dir}/output.mp3"
 
         export_pcm_to_mp3(pcm_data, output_path, bitrate="320k")
 
-        call_args = mock_ffmpeg.call_args
+        call_args = mock_ffmpeg_stream.call_args
         cmd = call_args[0][0]
         assert "320k" in cmd
 
-    def test_float_data_converted_to_int16(self, temp_dir, mock_ffmpeg):
+    def test_float_data_converted_to_int16(self, temp_dir, mock_ffmpeg_stream):
         """Float data should be converted to int16."""
         pcm_data = np.array([0.5, -0.5], dtype=np.float32)
         output_path = f"{temp_dir}/output.mp3"
 
         export_pcm_to_mp3(pcm_data, output_path)
 
-        # Verify input was provided (conversion happened)
-        call_args = mock_ffmpeg.call_args
-        assert call_args.kwargs.get("input") is not None
+        # Verify float samples were scaled into int16 range
+        written = written_bytes(mock_ffmpeg_stream.return_value)
+        np.testing.assert_array_equal(np.frombuffer(written, dtype=np.int16), [16383, -16383])
+
+    def test_float_saturation(self, temp_dir, mock_ffmpeg_stream):
+        """Out-of-range float samples should clip instead of wrapping around."""
+        pcm_data = np.array([2.0, -2.0, 1.0, -1.0], dtype=np.float32)
+
+        export_pcm_to_mp3(pcm_data, f"{temp_dir}/output.mp3")
+
+        written = written_bytes(mock_ffmpeg_stream.return_value)
+        np.testing.assert_array_equal(
+            np.frombuffer(written, dtype=np.int16), [32767, -32767, 32767, -32767]
+        )
+        np.testing.assert_array_equal(pcm_data, [2.0, -2.0, 1.0, -1.0])
 
-    def test_pcm_data_piped_to_ffmpeg(self, temp_dir, mock_ffmpeg):
+    def test_pcm_data_piped_to_ffmpeg(self, temp_dir, mock_ffmpeg_stream):
         """PCM data should be piped to ffmpeg stdin."""
         pcm_data = np.array([0, 16383, -16383], dtype=np.int16)
         output_path = f"{temp_dir}/output.mp3"
 
         export_pcm_to_mp3(pcm_data, output_path)
 
-        call_args = mock_ffmpeg.call_args
-        # Check that input bytes were provided
-        input_bytes = call_args.kwargs.get("input")
-        assert input_bytes is not None
+        proc = mock_ffmpeg_stream.return_value
+        proc.stdin.write.assert_called_once()
+        input_bytes = proc.stdin.write.call_args.args[0]
         assert len(input_bytes) == pcm_data.nbytes
+        # The int16 buffer is handed over as a view, not copied
+        assert isinstance(input_bytes, memoryview)
+        assert np.shares_memory(np.frombuffer(input_bytes, dtype=np.int16), pcm_data)
+        proc.stdin.close.assert_called_once()
+
+    def test_ffmpeg_pipe_is_enlarged(self, temp_dir, mock_ffmpeg_stream):
+        """The stdin pipe should be sized well above the 64 KiB default."""
+        export_pcm_to_mp3(np.array([0, 1000], dtype=np.int16), f"{temp_dir}/output.mp3")
+
+        assert mock_ffmpeg_stream.call_args.kwargs["pipesize"] == FFMPEG_PIPE_SIZE
+        assert FFMPEG_PIPE_SIZE >= 1 << 20
+
+    def test_close_fds_disabled(self, temp_dir, mock_ffmpeg, mock_ffmpeg_stream):
+        """ffmpeg launches should keep close_fds=False so posix_spawn can be used."""
+        export_pcm_to_mp3(np.array([0, 1000], dtype=np.int16), f"{temp_dir}/output.mp3")
+        export_pcm_to_mp3(np.array([], dtype=np.int16), f"{temp_dir}/silent.mp3")
+
+        assert mock_ffmpeg_stream.call_args.kwargs["close_fds"] is False
+        assert mock_ffmpeg.call_args.kwargs["close_fds"] is False
+
+    def test_large_buffer_is_written_in_one_call(self, temp_dir, mock_ffmpeg_stream):
+        """A multi-MB buffer should go to Popen stdin, not subprocess.run."""
+        pcm_data = np.zeros(5 * 1024 * 1024, dtype=np.int16)  # 10 MB
+
+        with patch("subprocess.run") as mock_run:
+            export_pcm_to_mp3(pcm_data, f"{temp_dir}/output.mp3")
+
+        mock_run.assert_not_called()
+        proc = mock_ffmpeg_stream.return_value
+        proc.stdin.write.assert_called_once()
+        assert proc.stdin.write.call_args.args[0].nbytes == pcm_data.nbytes
+
+    def test_segments_stream_through_single_ffmpeg_process(self, temp_dir, mock_ffmpeg_stream):
+        """An iterable of segments should be encoded by one ffmpeg process."""
+        segments = [
+            np.array([0, 100], dtype=np.int16),
+            np.array([], dtype=np.int16),
+            np.array([0.5, -0.5], dtype=np.float32),
+        ]
+        output_path = f"{temp_dir}/output.mp3"
+
+        with patch("subprocess.run") as mock_run:
+            export_pcm_to_mp3(iter(segments), output_path, bitrate="128k")
+
+        mock_run.assert_not_called()
+        mock_ffmpeg_stream.assert_called_once()
+        cmd = mock_ffmpeg_stream.call_args[0][0]
+        assert "pipe:0" in cmd
+        assert "128k" in cmd
+        assert output_path in cmd
+        proc = mock_ffmpeg_stream.return_value
+        np.testing.assert_array_equal(
+            np.frombuffer(written_bytes(proc), dtype=np.int16), [0, 100, 16383, -16383]
+        )
+        proc.stdin.close.assert_called_once()
+
+    def test_empty_segment_list_creates_silent_mp3(self, temp_dir, mock_ffmpeg):
+        """An iterable with no audio should fall back to the silent MP3 path."""
+        with patch("subprocess.Popen") as mock_popen:
+            export_pcm_to_mp3([np.array([], dtype=np.int16)], f"{temp_dir}/silent.mp3")
+
+        mock_popen.assert_not_called()
+        assert "anullsrc" in str(mock_ffmpeg.call_args[0][0])
@@ -1,12 +1,8 @@
 """Tests for the extract_epub_metadata function."""
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import app as app_module
 from app import extract_epub_metadata, BookMetadata
 
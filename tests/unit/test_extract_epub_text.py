@@ -1,12 +1,9 @@
 """Tests for the extract_epub_text function."""
 
 import pytest
-import sys
-from pathlib import Path
+import warnings
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import app
 from app import extract_epub_text, parse_epub
 
@@ -42,6 +39,43 @@ class TestExtractEpubText:
             assert "\n\n" in text
             assert "\n\n\n" not in text
 
+    def test_no_nbsp_leakage(self):
+        """Non-breaking spaces should collapse like ordinary whitespace."""
+        with patch("app.epub") as mock_epub:
+            mock_book = MagicMock()
+            mock_item = MagicMock()
+            mock_item.get_content.return_value = b"<html><body><p>a&nbsp;&nbsp;b</p></body></html>"
+            mock_book.get_items_of_type.return_value = [mock_item]
+            mock_epub.read_epub.return_value = mock_book
+
+            result = extract_epub_text("nbsp.epub")
+
+            assert result[0][1] == "a b"
+
+    def test_paragraph_boundaries_reach_chunker(self):
+        """Block elements should stay separate paragraphs through chunking."""
+        with patch("app.epub") as mock_epub:
+            mock_book = MagicMock()
+            mock_item = MagicMock()
+            mock_item.get_content.return_value = b"""
+            <html><body>
+                <p>First   paragraph
+                   spans lines.</p>
+                <p>Second paragraph.</p>
+            </body></html>
+            """
+            mock_book.get_items_of_type.return_value = [mock_item]
+            mock_epub.read_epub.return_value = mock_book
+
+            result = extract_epub_text("paragraphs.epub")
+            chunks, _ = app.split_text_to_chunks(result, chunk_chars=30)
+
+            assert result[0][1] == "First paragraph spans lines.\n\nSecond paragraph."
+            assert [chunk.text for chunk in chunks] == [
+                "First paragraph spans lines.",
+                "Second paragraph.",
+            ]
+
     def test_empty_epub_raises_error(self):
         """EPUB with no readable content should raise ValueError."""
         with patch("app.epub") as mock_epub:
@@ -107,6 +141,21 @@ class TestExtractEpubText:
             _, text = result[0]
             assert "Real content" in text
 
+    def test_blank_document_skips_html_parser(self):
+        """Whitespace-only documents should be dropped before HTML parsing."""
+        with patch("app.epub") as mock_epub:
+            mock_book = MagicMock()
+            mock_item = MagicMock()
+            mock_item.get_content.return_value = b"   \n   "
+            mock_book.get_items_of_type.return_value = [mock_item]
+            mock_epub.read_epub.return_value = mock_book
+
+            with patch("audiobook_backend.epub_parser.BeautifulSoup") as mock_parser:
+                with pytest.raises(ValueError):
+                    extract_epub_text("blank.epub")
+
+            mock_parser.assert_not_called()
+
     def test_html_tags_stripped(self):
         """HTML tags should be stripped from content."""
         with patch("app.epub") as mock_epub:
@@ -134,6 +183,47 @@ class TestExtractEpubText:
             assert "bold" in text
             assert "italic" in text
 
+    def test_large_chapter_is_extracted(self):
+        """A ~500 KB chapter should parse into clean paragraphs."""
+        paragraph = b"<p>Some   words\n   wrapped <em>across</em> lines.</p>\n"
+        content = b"<html><body>" + paragraph * (500_000 // len(paragraph)) + b"</body></html>"
+        with patch("app.epub") as mock_epub:
+            mock_book = MagicMock()
+            mock_item = MagicMock()
+            mock_item.get_content.return_value = content
+            mock_book.get_items_of_type.return_value = [mock_item]
+            mock_epub.read_epub.return_value = mock_book
+
+            result = extract_epub_text("large.epub")
+
+            _, text = result[0]
+            paragraphs = text.split("\n\n")
+            assert len(paragraphs) == 500_000 // len(paragraph)
+            assert set(paragraphs) == {"Some words wrapped across lines."}
+
+    @pytest.mark.parametrize("features", ["lxml", "html.parser"])
+    def test_xml_prolog_chapter_emits_no_warning(self, monkeypatch, features):
+        """XHTML chapters with an XML prolog should parse quietly with either tree builder."""
+        monkeypatch.setattr("audiobook_backend.epub_parser.HTML_PARSER_FEATURES", features)
+        # bs4 only sniffs the first 500 bytes, so push <html> past them.
+        content = (
+            b'<?xml version="1.0" encoding="utf-8"?>\n'
+            b"<!-- " + b"x" * 600 + b" -->\n"
+            b'<html xmlns="http://www.w3.org/1999/xhtml"><body><p>Prolog chapter.</p></body></html>'
+        )
+        with patch("app.epub") as mock_epub:
+            mock_book = MagicMock()
+            mock_item = MagicMock()
+            mock_item.get_content.return_value = content
+            mock_book.get_items_of_type.return_value = [mock_item]
+            mock_epub.read_epub.return_value = mock_book
+
+            with warnings.catch_warnings(record=True) as caught:
+                result = extract_epub_text("prolog.epub")
+
+        assert result == [("Chapter 1", "Prolog chapter.")]
+        assert not [w for w in caught if "XML" in w.category.__name__]
+
     def test_parse_epub_ignores_navigation_documents_and_head_text(self):
         """Navigation-only docs should be skipped and title text should not leak into body text."""
         with patch("app.epub") as mock_epub:
@@ -1,37 +1,40 @@
 """Tests for the TTS backend generate functionality."""
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from backends import create_backend, TTSBackend
+from backends.base import compile_split_pattern
 from backends.kokoro_pytorch import KokoroPyTorchBackend
 from backends.mock import MockTTSBackend
 
 
+@pytest.fixture(scope="module")
+def kokoro_backend():
+    """One uninitialized PyTorch backend shared by the generate tests."""
+    return KokoroPyTorchBackend()
+
+
 @pytest.mark.unit
 class TestTTSBackendGenerate:
     """Test cases for TTS backend generate functionality."""
 
-    def test_pytorch_backend_yields_audio_arrays(self):
+    @pytest.fixture
+    def backend(self, kokoro_backend, mock_pipeline):
+        """The shared backend with this test's mock pipeline attached."""
+        kokoro_backend._pipeline = mock_pipeline
+        yield kokoro_backend
+        kokoro_backend._pipeline = None
+
+    def test_pytorch_backend_yields_audio_arrays(self, backend, mock_pipeline, mock_audio_frame):
         """PyTorch backend should yield audio arrays from pipeline."""
-        backend = KokoroPyTorchBackend()
-
-        # Mock the pipeline
-        mock_pipeline = MagicMock()
-        mock_audio = np.random.randn(24000).astype(np.float32)
-        mock_pipeline.return_value = [
-            ("graphemes1", "phonemes1", mock_audio),
-            ("graphemes2", "phonemes2", mock_audio),
+        mock_pipeline.ret = [
+            ("graphemes1", "phonemes1", mock_audio_frame),
+            ("graphemes2", "phonemes2", mock_audio_frame),
         ]
 
-        backend._pipeline = mock_pipeline
-
         results = list(backend.generate(
             text="Hello world",
             voice="af_heart",
@@ -42,15 +45,10 @@ class TestTTSBackendGenerate:
         assert len(results) == 2
         for result in results:
             assert isinstance(result, np.ndarray)
+            assert result.shape == mock_audio_frame.shape
 
-    def test_pytorch_backend_passes_params_to_pipeline(self):
+    def test_pytorch_backend_passes_params_to_pipeline(self, backend, mock_pipeline):
         """PyTorch backend should pass correct parameters to pipeline."""
-        backend = KokoroPyTorchBackend()
-
-        mock_pipeline = MagicMock()
-        mock_pipeline.return_value = []
-        backend._pipeline = mock_pipeline
-
         list(backend.generate(
             text="Test text",
             voice="af_bella",
@@ -58,19 +56,14 @@ class TestTTSBackendGenerate:
             split_pattern=r"\n+",
         ))
 
-        mock_pipeline.assert_called_once_with(
-            "Test text",
-            voice="af_bella",
-            speed=1.5,
-            split_pattern=r"\n+",
-        )
+        assert mock_pipeline.calls == [
+            (("Test text",), {"voice": "af_bella", "speed": 1.5, "split_pattern": r"\n+"}),
+        ]
 
-    def test_backend_not_initialized_raises_error(self):
+    def test_backend_not_initialized_raises_error(self, kokoro_backend):
         """Backend should raise error if generate called before initialize."""
-        backend = KokoroPyTorchBackend()
-
         with pytest.raises(RuntimeError) as excinfo:
-            list(backend.generate(
+            list(kokoro_backend.generate(
                 text="Test",
                 voice="af_heart",
                 speed=1.0,
@@ -78,14 +71,8 @@ class TestTTSBackendGenerate:
 
         assert "not initialized" in str(excinfo.value)
 
-    def test_backend_empty_text(self):
+    def test_backend_empty_text(self, backend):
         """Empty text should yield nothing."""
-        backend = KokoroPyTorchBackend()
-
-        mock_pipeline = MagicMock()
-        mock_pipeline.return_value = []
-        backend._pipeline = mock_pipeline
-
         results = list(backend.generate(
             text="",
             voice="af_heart",
@@ -95,22 +82,17 @@ class TestTTSBackendGenerate:
 
         assert results == []
 
-    def test_backend_generator_behavior(self):
+    def test_backend_generator_behavior(self, backend, mock_pipeline, mock_audio_frame):
         """Backend generate should be a generator, not eagerly evaluated."""
-        backend = KokoroPyTorchBackend()
-
-        mock_audio = np.random.randn(24000).astype(np.float32)
-
         # Use a list with side effects to track iteration
         call_count = [0]
 
         def mock_generator(*args, **kwargs):
             for i in range(3):
                 call_count[0] += 1
-                yield (f"g{i}", f"p{i}", mock_audio)
+                yield (f"g{i}", f"p{i}", mock_audio_frame)
 
-        mock_pipeline = MagicMock(side_effect=mock_generator)
-        backend._pipeline = mock_pipeline
+        mock_pipeline.ret = mock_generator
 
         gen = backend.generate(
             text="Test",
@@ -127,14 +109,8 @@ class TestTTSBackendGenerate:
         next(gen)
         assert call_count[0] == initial_count + 1
 
-    def test_backend_different_voices(self):
+    def test_backend_different_voices(self, backend, mock_pipeline):
         """Backend should handle different voice parameters."""
-        backend = KokoroPyTorchBackend()
-
-        mock_pipeline = MagicMock()
-        mock_pipeline.return_value = []
-        backend._pipeline = mock_pipeline
-
         voices = ["af_heart", "af_bella", "am_adam", "bf_emma", "bm_george"]
 
         for voice in voices:
@@ -146,17 +122,10 @@ class TestTTSBackendGenerate:
             ))
 
             # Verify voice was passed correctly
-            last_call = mock_pipeline.call_args
-            assert last_call.kwargs["voice"] == voice
+            assert mock_pipeline.calls[-1][1]["voice"] == voice
 
-    def test_backend_different_speeds(self):
+    def test_backend_different_speeds(self, backend, mock_pipeline):
         """Backend should handle different speed parameters."""
-        backend = KokoroPyTorchBackend()
-
-        mock_pipeline = MagicMock()
-        mock_pipeline.return_value = []
-        backend._pipeline = mock_pipeline
-
         speeds = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
 
         for speed in speeds:
@@ -167,19 +136,36 @@ class TestTTSBackendGenerate:
                 split_pattern=r"\n+",
             ))
 
-            last_call = mock_pipeline.call_args
-            assert last_call.kwargs["speed"] == speed
+            assert mock_pipeline.calls[-1][1]["speed"] == speed
+
+    def test_split_pattern_cached(self):
+        """Repeated generate calls should compile the same split pattern once."""
+        backend = create_backend("mock")
+        backend.initialize()
+        compile_split_pattern.cache_clear()
+
+        list(backend.generate("One\nTwo", voice="af_heart", speed=1.0, split_pattern=r"\n+"))
+        list(backend.generate("Three\nFour", voice="af_heart", speed=1.0, split_pattern=r"\n+"))
+
+        info = compile_split_pattern.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert compile_split_pattern(r"\n+") is compile_split_pattern(r"\n+")
 
 
 @pytest.mark.unit
 class TestBackendFactory:
     """Test cases for backend factory function."""
 
-    def test_create_pytorch_backend(self):
-        """Factory should create PyTorch backend."""
-        backend = create_backend("pytorch")
-        assert backend.name == "pytorch"
-        assert isinstance(backend, KokoroPyTorchBackend)
+    @pytest.mark.parametrize(
+        "backend_type, backend_cls",
+        [("pytorch", KokoroPyTorchBackend), ("mock", MockTTSBackend)],
+    )
+    def test_create_backend(self, backend_type, backend_cls):
+        """Factory should create the requested backend with its properties."""
+        backend = create_backend(backend_type)
+        assert isinstance(backend, backend_cls)
+        assert backend.name == backend_type
+        assert backend.sample_rate == 24000
 
     def test_create_invalid_backend(self):
         """Factory should raise error for invalid backend type."""
@@ -187,15 +173,3 @@ class TestBackendFactory:
             create_backend("invalid")
 
         assert "Unknown backend type" in str(excinfo.value)
-
-    def test_backend_properties(self):
-        """Backend should have correct properties."""
-        backend = create_backend("pytorch")
-        assert backend.name == "pytorch"
-        assert backend.sample_rate == 24000
-
-    def test_create_mock_backend(self):
-        """Factory should create mock backend for tests."""
-        backend = create_backend("mock")
-        assert backend.name == "mock"
-        assert isinstance(backend, MockTTSBackend)
@@ -1,10 +1,6 @@
 """Tests for the generate_ffmetadata function."""
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app import (
     generate_ffmetadata,
@@ -1,185 +1,141 @@
 """Tests for the parse_args function."""
 
-import pytest
 import sys
-from pathlib import Path
-from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import pytest
 
 from app import parse_args
+from audiobook_backend.cli import _build_parser
+
+# sys.argv is only replaced through monkeypatch, which restores it after each
+# test, so nothing here needs pinning to one xdist worker.
+pytestmark = pytest.mark.unit
+
+BASE_ARGV = ("--input", "test.epub", "--output", "test.mp3")
+
+
+@pytest.fixture
+def set_argv(monkeypatch):
+    """Replace sys.argv for a parse_args() call that reads the real command line."""
+    return lambda argv: monkeypatch.setattr(sys, "argv", argv)
+
+
+@pytest.fixture(scope="session")
+def default_args():
+    """Namespace parsed from BASE_ARGV alone; tests only read from it."""
+    return parse_args(BASE_ARGV)
 
 
-@pytest.mark.unit
 class TestParseArgs:
     """Test cases for parse_args function."""
 
-    def test_required_args(self):
+    def test_required_args(self, set_argv):
         """Should parse required arguments."""
-        with patch("sys.argv", ["app.py", "--input", "book.epub", "--output", "book.mp3"]):
-            args = parse_args()
+        set_argv(["app.py", "--input", "book.epub", "--output", "book.mp3"])
+        args = parse_args()
 
-            assert args.input == "book.epub"
-            assert args.output == "book.mp3"
+        assert args.input == "book.epub"
+        assert args.output == "book.mp3"
 
-    def test_default_values(self):
+    def test_default_values(self, default_args):
         """Should use default values when not specified."""
-        with patch("sys.argv", ["app.py", "--input", "test.epub", "--output", "test.mp3"]):
-            args = parse_args()
-
-            assert args.voice == "af_heart"
-            assert args.lang_code == "a"
-            assert args.speed == 1.0
-            # chunk_chars defaults to None, resolved at runtime based on backend
-            # (900 for MLX, 600 for PyTorch)
-            assert args.chunk_chars is None
-            assert args.split_pattern == r"\n+"
-            assert args.workers == 2
-            assert args.pipeline_mode is None
-            assert args.prefetch_chunks == 2
-            assert args.pcm_queue_size == 4
-            assert args.no_rich is False
-            assert args.backend == "auto"
-            assert args.device == "auto"
-            assert args.checkpoint is False
-            assert args.event_format == "text"
-            assert args.log_file is None
-
-    def test_custom_voice(self):
-        """Should accept custom voice."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--voice", "bf_emma"
-        ]):
-            args = parse_args()
-            assert args.voice == "bf_emma"
-
-    def test_custom_speed(self):
-        """Should accept custom speed."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--speed", "1.5"
-        ]):
-            args = parse_args()
-            assert args.speed == 1.5
-
-    def test_custom_chunk_chars(self):
-        """Should accept custom chunk_chars."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--chunk_chars", "2000"
-        ]):
-            args = parse_args()
-            assert args.chunk_chars == 2000
-
-    def test_custom_workers(self):
-        """Should accept custom workers count."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--workers", "4"
-        ]):
-            args = parse_args()
-            assert args.workers == 4
-
-    def test_custom_pipeline_mode_and_queue_sizes(self):
-        """Should accept overlap pipeline tuning args."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--pipeline_mode", "overlap3",
-            "--prefetch_chunks", "3",
-            "--pcm_queue_size", "6",
-        ]):
-            args = parse_args()
-            assert args.pipeline_mode == "overlap3"
-            assert args.prefetch_chunks == 3
-            assert args.pcm_queue_size == 6
-
-    def test_backend_auto(self):
-        """Should accept auto backend selection."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--backend", "auto"
-        ]):
-            args = parse_args()
-            assert args.backend == "auto"
-
-    def test_custom_device(self):
-        """Should accept explicit device selection."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--device", "cpu"
-        ]):
-            args = parse_args()
-            assert args.device == "cpu"
-
-    def test_checkpoint_flag(self):
-        """Should accept --checkpoint flag."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--checkpoint"
-        ]):
-            args = parse_args()
-            assert args.checkpoint is True
-
-    def test_no_rich_flag(self):
-        """Should accept --no_rich flag."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--no_rich"
-        ]):
-            args = parse_args()
-            assert args.no_rich is True
-
-    def test_custom_lang_code(self):
-        """Should accept custom lang_code."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--lang_code", "b"
-        ]):
-            args = parse_args()
-            assert args.lang_code == "b"
-
-    def test_custom_split_pattern(self):
-        """Should accept custom split_pattern."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--split_pattern", r"\.\s+"
-        ]):
-            args = parse_args()
-            assert args.split_pattern == r"\.\s+"
-
-    def test_event_format_and_log_file(self):
-        """Should accept structured IPC format and backend log file path."""
-        with patch("sys.argv", [
-            "app.py", "--input", "test.epub", "--output", "test.mp3",
-            "--event_format", "json",
-            "--log_file", "/tmp/backend.log",
-        ]):
-            args = parse_args()
-            assert args.event_format == "json"
-            assert args.log_file == "/tmp/backend.log"
-
-    def test_missing_required_args(self):
+        args = default_args
+
+        assert args.voice == "af_heart"
+        assert args.lang_code == "a"
+        assert args.speed == 1.0
+        # chunk_chars defaults to None, resolved at runtime based on backend
+        # (900 for MLX, 600 for PyTorch)
+        assert args.chunk_chars is None
+        assert args.split_pattern == r"\n+"
+        assert args.workers == 2
+        assert args.pipeline_mode is None
+        assert args.prefetch_chunks == 2
+        assert args.pcm_queue_size == 4
+        assert args.no_rich is False
+        assert args.backend == "auto"
+        assert args.device == "auto"
+        assert args.checkpoint is False
+        assert args.event_format == "text"
+        assert args.log_file is None
+
+    @pytest.mark.parametrize(
+        "extra_argv, attr, expected",
+        [
+            (["--voice", "bf_emma"], "voice", "bf_emma"),
+            (["--speed", "1.5"], "speed", 1.5),
+            (["--chunk_chars", "2000"], "chunk_chars", 2000),
+            (["--workers", "4"], "workers", 4),
+            (["--pipeline_mode", "overlap3"], "pipeline_mode", "overlap3"),
+            (["--prefetch_chunks", "3"], "prefetch_chunks", 3),
+            (["--pcm_queue_size", "6"], "pcm_queue_size", 6),
+            (["--backend", "auto"], "backend", "auto"),
+            (["--device", "cpu"], "device", "cpu"),
+            (["--lang_code", "b"], "lang_code", "b"),
+            (["--split_pattern", r"\.\s+"], "split_pattern", r"\.\s+"),
+            (["--event_format", "json"], "event_format", "json"),
+            (["--log_file", "/tmp/backend.log"], "log_file", "/tmp/backend.log"),
+        ],
+    )
+    def test_custom_arg(self, extra_argv, attr, expected):
+        """Should accept each optional argument and convert its type."""
+        args = parse_args([*BASE_ARGV, *extra_argv])
+        assert getattr(args, attr) == expected
+
+    @pytest.mark.parametrize("flag, attr", [("--checkpoint", "checkpoint"), ("--no_rich", "no_rich")])
+    def test_boolean_flag(self, default_args, flag, attr):
+        """Store-true flags should default to False and flip to True when given."""
+        assert getattr(default_args, attr) is False
+        assert getattr(parse_args([*BASE_ARGV, flag]), attr) is True
+
+    def test_equals_form_and_choice_validation(self):
+        """The cached parser should keep argparse's --flag=value and choices handling."""
+        args = parse_args([*BASE_ARGV, "--speed=1.5", "--format=m4b"])
+        assert args.speed == 1.5
+        assert args.format == "m4b"
+
+        with pytest.raises(SystemExit):
+            parse_args([*BASE_ARGV, "--format", "aac"])
+
+    def test_cached_parser_does_not_leak_state(self):
+        """Values from one parse must not become defaults for the next."""
+        parse_args([*BASE_ARGV, "--voice", "bf_emma", "--checkpoint", "--workers", "4"])
+
+        args = parse_args(BASE_ARGV)
+
+        assert args.voice == "af_heart"
+        assert args.checkpoint is False
+        assert args.workers == 2
+
+    def test_parser_is_built_once(self):
+        """Repeated parse_args calls should reuse one cached parser."""
+        parse_args(BASE_ARGV)
+        parse_args([*BASE_ARGV, "--voice", "bf_emma"])
+
+        assert _build_parser.cache_info().currsize == 1
+        assert _build_parser() is _build_parser()
+
+    def test_missing_required_args(self, set_argv):
         """Should fail when required args missing."""
-        with patch("sys.argv", ["app.py"]):
-            with pytest.raises(SystemExit):
-                parse_args()
+        set_argv(["app.py"])
+        with pytest.raises(SystemExit):
+            parse_args()
 
-    def test_missing_input(self):
+    def test_missing_input(self, set_argv):
         """Should fail when --input missing."""
-        with patch("sys.argv", ["app.py", "--output", "test.mp3"]):
-            with pytest.raises(SystemExit):
-                parse_args()
+        set_argv(["app.py", "--output", "test.mp3"])
+        with pytest.raises(SystemExit):
+            parse_args()
 
-    def test_missing_output(self):
+    def test_missing_output(self, set_argv):
         """Should fail when --output missing."""
-        with patch("sys.argv", ["app.py", "--input", "test.epub"]):
-            with pytest.raises(SystemExit):
-                parse_args()
+        set_argv(["app.py", "--input", "test.epub"])
+        with pytest.raises(SystemExit):
+            parse_args()
 
-    def test_all_args_combined(self):
+    def test_all_args_combined(self, set_argv):
         """Should handle all arguments together."""
-        with patch("sys.argv", [
+        set_argv([
             "app.py",
             "--input", "my_book.epub",
             "--output", "my_audiobook.mp3",
@@ -198,23 +154,23 @@ class TestParseArgs:
             "--event_format", "json",
             "--log_file", "/tmp/run.log",
             "--no_rich",
-        ]):
-            args = parse_args()
-
-            assert args.input == "my_book.epub"
-            assert args.output == "my_audiobook.mp3"
-            assert args.voice == "am_michael"
-            assert args.speed == 1.25
-            assert args.lang_code == "a"
-            assert args.chunk_chars == 1500
-            assert args.split_pattern == r"\n+"
-            assert args.workers == 3
-            assert args.pipeline_mode == "sequential"
-            assert args.prefetch_chunks == 5
-            assert args.pcm_queue_size == 7
-            assert args.backend == "auto"
-            assert args.device == "mps"
-            assert args.checkpoint is True
-            assert args.event_format == "json"
-            assert args.log_file == "/tmp/run.log"
-            assert args.no_rich is True
+        ])
+        args = parse_args()
+
+        assert args.input == "my_book.epub"
+        assert args.output == "my_audiobook.mp3"
+        assert args.voice == "am_michael"
+        assert args.speed == 1.25
+        assert args.lang_code == "a"
+        assert args.chunk_chars == 1500
+        assert args.split_pattern == r"\n+"
+        assert args.workers == 3
+        assert args.pipeline_mode == "sequential"
+        assert args.prefetch_chunks == 5
+        assert args.pcm_queue_size == 7
+        assert args.backend == "auto"
+        assert args.device == "mps"
+        assert args.checkpoint is True
+        assert args.event_format == "json"
+        assert args.log_file == "/tmp/run.log"
+        assert args.no_rich is True
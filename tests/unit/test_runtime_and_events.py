@@ -2,7 +2,9 @@
 
 import json
 import subprocess
-import sys
+import tempfile
+import threading
+import zipfile
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -10,8 +12,6 @@ from unittest.mock import MagicMock
 import numpy as np
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import app
 from backends.factory import get_available_backends
 from backends.kokoro_mlx import is_mlx_available
@@ -58,6 +58,7 @@ def build_main_args(tmp_path: Path, **overrides) -> SimpleNamespace:
 class FakeProc:
     def __init__(self):
         self.stdin = MagicMock()
+        self.stderr = MagicMock()
         self.returncode = None
         self.wait = MagicMock(side_effect=self._wait)
         self.kill = MagicMock(side_effect=self._kill)
@@ -239,6 +240,25 @@ class TestEventEmitter:
         captured = capsys.readouterr()
         assert 'INSPECTION:{"output_path": "book.mp3", "total_chunks": 4}' in captured.out
 
+    def test_batched_events_flush_once_on_exit(self, monkeypatch, tmp_path):
+        log_path = tmp_path / "events.log"
+        stdout = MagicMock()
+        monkeypatch.setattr(app.sys, "stdout", stdout)
+        emitter = app.EventEmitter(event_format="text", log_file=str(log_path))
+
+        with emitter.batched():
+            with emitter.batched():
+                emitter.emit("timing", chunk_idx=0, chunk_timing_ms=12)
+            emitter.emit("progress", current_chunk=1, total_chunks=2)
+            stdout.flush.assert_not_called()
+            assert log_path.read_text(encoding="utf-8") == ""
+
+        stdout.flush.assert_called_once()
+        assert log_path.read_text(encoding="utf-8") == "TIMING:0:12\nPROGRESS:1/2 chunks\n"
+        emitter.emit("done")
+        assert stdout.flush.call_count == 2
+        emitter.close()
+
 
 @pytest.mark.unit
 class TestInspectionMode:
@@ -368,28 +388,58 @@ class TestMp3StreamHelpers:
         assert "loudnorm=I=-14:TP=-1:LRA=11" in cmd
         assert cmd[-1] == "out.mp3"
 
+    def test_open_mp3_export_stream_logs_stderr_to_temp_file(self, monkeypatch):
+        popen_mock = MagicMock(return_value=MagicMock())
+        monkeypatch.setattr(app.shutil, "which", lambda _: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(app.subprocess, "Popen", popen_mock)
+
+        proc = app.open_mp3_export_stream("out.mp3")
+
+        kwargs = popen_mock.call_args.kwargs
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] not in (subprocess.PIPE, subprocess.DEVNULL)
+        assert proc.stderr is kwargs["stderr"]
+        proc.stderr.close()
+
+    def test_cleanup_ffmpeg_process_closes_stderr_log(self, monkeypatch):
+        popen_mock = MagicMock(return_value=FakeProc())
+        monkeypatch.setattr(app.shutil, "which", lambda _: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(app.subprocess, "Popen", popen_mock)
+
+        proc = app.open_mp3_export_stream("out.mp3")
+        stderr_log = proc.stderr
+
+        assert app._cleanup_ffmpeg_process(proc) is None
+        assert stderr_log.closed
+
     def test_close_mp3_export_stream_closes_stdin_and_waits(self):
+        stderr_log = MagicMock()
         proc = SimpleNamespace(
             stdin=MagicMock(),
-            stderr=SimpleNamespace(read=MagicMock(return_value=b"")),
+            stderr=stderr_log,
             wait=MagicMock(return_value=0),
         )
 
         app.close_mp3_export_stream(proc)  # type: ignore[arg-type]
 
         proc.stdin.close.assert_called_once()
-        proc.stderr.read.assert_called_once()
         proc.wait.assert_called_once()
+        # stderr is only read when ffmpeg fails
+        stderr_log.read.assert_not_called()
+        stderr_log.close.assert_called_once()
 
     def test_close_mp3_export_stream_raises_on_ffmpeg_failure(self):
+        stderr_log = tempfile.TemporaryFile()
+        stderr_log.write(b"bad audio")
         proc = SimpleNamespace(
             stdin=MagicMock(),
-            stderr=SimpleNamespace(read=MagicMock(return_value=b"bad audio")),
+            stderr=stderr_log,
             wait=MagicMock(return_value=1),
         )
 
         with pytest.raises(RuntimeError, match="ffmpeg failed: bad audio"):
             app.close_mp3_export_stream(proc)  # type: ignore[arg-type]
+        assert stderr_log.closed
 
 
 @pytest.mark.unit
@@ -431,6 +481,7 @@ class TestMainCleanupBehavior:
         backend.cleanup.assert_called_once()
         proc.stdin.close.assert_called_once()
         proc.wait.assert_called_once_with(timeout=5)
+        proc.stderr.close.assert_called_once()
         gc_collect.assert_called_once()
         events.error.assert_called_once_with("inference failed")
         events.close.assert_called_once()
@@ -491,6 +542,96 @@ class TestMainCleanupBehavior:
         events.error.assert_called_once_with("export failed")
         events.close.assert_called_once()
 
+    def test_main_initializes_backend_while_epub_is_parsed(self, monkeypatch, tmp_path):
+        args = build_main_args(tmp_path, format="wav", output=str(tmp_path / "output.wav"))
+        events = MagicMock()
+        backend_ready = threading.Event()
+        parsed_epub = app.ParsedEpub(
+            metadata=app.BookMetadata(title="Title", author="Author"),
+            chapters=[("Chapter 1", "Hello world")],
+        )
+        backend = SimpleNamespace(
+            name="mock",
+            sample_rate=24000,
+            initialize=MagicMock(side_effect=lambda **kwargs: backend_ready.set()),
+            generate=MagicMock(return_value=[np.array([1, 2], dtype=np.int16)]),
+            cleanup=MagicMock(),
+        )
+
+        def slow_parse(*args, progress_callback=None, **kwargs):
+            # The archive opened fine; the rest of parsing only finishes once
+            # the backend has been initialized, which needs the two to overlap.
+            progress_callback(1, 1, 0)
+            assert backend_ready.wait(timeout=5)
+            return parsed_epub
+
+        resolve_backend = MagicMock(return_value="mock")
+        monkeypatch.setattr(app.sys, "version_info", (3, 12, 0))
+        monkeypatch.setattr(app, "parse_args", lambda: args)
+        monkeypatch.setattr(app, "EventEmitter", lambda **kwargs: events)
+        monkeypatch.setattr(app, "resolve_backend", resolve_backend)
+        monkeypatch.setattr(app, "parse_epub", slow_parse)
+        monkeypatch.setattr(app, "create_backend", lambda _: backend)
+        monkeypatch.setattr(app, "export_pcm_file_to_wav", MagicMock())
+
+        app.main()
+
+        backend.initialize.assert_called_once_with(lang_code="a", device="cpu")
+        app.export_pcm_file_to_wav.assert_called_once()
+        resolve_backend.assert_called_once_with("mock")
+
+    def test_main_reports_unreadable_epub_before_loading_backend(self, monkeypatch, tmp_path):
+        args = build_main_args(tmp_path)
+        events = MagicMock()
+        backend = SimpleNamespace(initialize=MagicMock(), cleanup=MagicMock())
+
+        def unreadable_epub(*args, **kwargs):
+            raise zipfile.BadZipFile("File is not a zip file")
+
+        monkeypatch.setattr(app.sys, "version_info", (3, 12, 0))
+        monkeypatch.setattr(app, "parse_args", lambda: args)
+        monkeypatch.setattr(app, "EventEmitter", lambda **kwargs: events)
+        monkeypatch.setattr(app, "resolve_backend", lambda _: "mock")
+        monkeypatch.setattr(app, "parse_epub", unreadable_epub)
+        monkeypatch.setattr(app, "create_backend", lambda _: backend)
+
+        with pytest.raises(zipfile.BadZipFile):
+            app.main()
+
+        backend.initialize.assert_not_called()
+
+    def test_main_prefers_parse_error_over_backend_import_error(self, monkeypatch, tmp_path):
+        args = build_main_args(tmp_path)
+        events = MagicMock()
+        init_attempted = threading.Event()
+
+        def missing_backend(**kwargs):
+            init_attempted.set()
+            raise ImportError("no kokoro")
+
+        backend = SimpleNamespace(
+            initialize=MagicMock(side_effect=missing_backend),
+            cleanup=MagicMock(),
+        )
+
+        def failing_parse(*args, progress_callback=None, **kwargs):
+            # Fail only after the archive opened and the backend import failed.
+            progress_callback(1, 1, 0)
+            assert init_attempted.wait(timeout=5)
+            raise ValueError("No readable text content found in EPUB.")
+
+        monkeypatch.setattr(app.sys, "version_info", (3, 12, 0))
+        monkeypatch.setattr(app, "parse_args", lambda: args)
+        monkeypatch.setattr(app, "EventEmitter", lambda **kwargs: events)
+        monkeypatch.setattr(app, "resolve_backend", lambda _: "mock")
+        monkeypatch.setattr(app, "parse_epub", failing_parse)
+        monkeypatch.setattr(app, "create_backend", lambda _: backend)
+
+        with pytest.raises(ValueError, match="No readable text"):
+            app.main()
+
+        backend.cleanup.assert_called_once()
+
     def test_main_reads_epub_once_for_m4b(self, monkeypatch, tmp_path):
         args = build_main_args(
             tmp_path,
@@ -588,6 +729,81 @@ class TestMainCleanupBehavior:
             app.ChapterInfo(title="Chapter 2", start_sample=5, end_sample=9),
         ]
 
+    def test_main_exports_wav_from_spool(self, monkeypatch, tmp_path):
+        args = build_main_args(
+            tmp_path,
+            output=str(tmp_path / "output.wav"),
+            format="wav",
+        )
+        events = MagicMock()
+        parsed_epub = app.ParsedEpub(
+            metadata=app.BookMetadata(title="Title", author="Author"),
+            chapters=[("Chapter 1", "Hello world")],
+        )
+        backend = SimpleNamespace(
+            name="mock",
+            sample_rate=24000,
+            initialize=MagicMock(),
+            generate=MagicMock(return_value=[np.array([100, -100, 200], dtype=np.int16)]),
+            cleanup=MagicMock(),
+        )
+        export_wav = MagicMock()
+
+        monkeypatch.setattr(app.sys, "version_info", (3, 12, 0))
+        monkeypatch.setattr(app, "parse_args", lambda: args)
+        monkeypatch.setattr(app, "EventEmitter", lambda **kwargs: events)
+        monkeypatch.setattr(app, "resolve_backend", lambda _: "mock")
+        monkeypatch.setattr(app, "parse_epub", lambda *args, **kwargs: parsed_epub)
+        monkeypatch.setattr(app, "create_backend", lambda _: backend)
+        monkeypatch.setattr(app, "open_mp3_export_stream", MagicMock())
+        monkeypatch.setattr(app, "export_pcm_file_to_wav", export_wav)
+
+        app.main()
+
+        app.open_mp3_export_stream.assert_not_called()
+        export_wav.assert_called_once()
+        spool_path = export_wav.call_args.args[0]
+        assert export_wav.call_args.args[1] == args.output
+        assert export_wav.call_args.kwargs == {"sample_rate": 24000, "normalize": False}
+        assert not Path(spool_path).exists()
+
+    def test_main_exports_flac_with_soundfile(self, monkeypatch, tmp_path):
+        args = build_main_args(
+            tmp_path,
+            output=str(tmp_path / "output.flac"),
+            format="flac",
+            normalize=True,
+        )
+        events = MagicMock()
+        parsed_epub = app.ParsedEpub(
+            metadata=app.BookMetadata(title="Title", author="Author"),
+            chapters=[("Chapter 1", "Hello world")],
+        )
+        backend = SimpleNamespace(
+            name="mock",
+            sample_rate=24000,
+            initialize=MagicMock(),
+            generate=MagicMock(return_value=[np.array([100, -100, 200], dtype=np.int16)]),
+            cleanup=MagicMock(),
+        )
+        export_soundfile = MagicMock()
+
+        monkeypatch.setattr(app.sys, "version_info", (3, 12, 0))
+        monkeypatch.setattr(app, "parse_args", lambda: args)
+        monkeypatch.setattr(app, "EventEmitter", lambda **kwargs: events)
+        monkeypatch.setattr(app, "resolve_backend", lambda _: "mock")
+        monkeypatch.setattr(app, "parse_epub", lambda *args, **kwargs: parsed_epub)
+        monkeypatch.setattr(app, "create_backend", lambda _: backend)
+        monkeypatch.setattr(app, "open_mp3_export_stream", MagicMock())
+        monkeypatch.setattr(app, "export_pcm_file_with_soundfile", export_soundfile)
+
+        app.main()
+
+        app.open_mp3_export_stream.assert_not_called()
+        export_soundfile.assert_called_once()
+        assert export_soundfile.call_args.args[1:] == (args.output, "flac")
+        assert export_soundfile.call_args.kwargs == {"sample_rate": 24000, "normalize": True}
+
 
 @pytest.mark.unit
 class TestBackendAvailabilityHelpers:
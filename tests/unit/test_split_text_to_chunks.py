@@ -1,15 +1,18 @@
 """Tests for the split_text_to_chunks function."""
 
+import re
+
 import pytest
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from app import split_text_to_chunks, SplitResult, TextChunk
+from audiobook_backend.chunking import _paragraph_splitter, _split_oversize
+
+pytestmark = pytest.mark.unit
 
-from app import split_text_to_chunks, TextChunk
+LONG_PARAGRAPH = "A" * 2000
+MANY_PARAGRAPHS = "\n\n".join(f"Para {i} " + "x" * 50 for i in range(20))
 
 
-@pytest.mark.unit
 class TestSplitTextToChunks:
     """Test cases for split_text_to_chunks function."""
 
@@ -75,13 +78,26 @@ class TestSplitTextToChunks:
 
     def test_long_paragraph(self):
         """Long paragraphs should be split to respect chunk_chars."""
-        long_paragraph = "A" * 2000  # 2000 character paragraph
-        chapters = [("Chapter 1", long_paragraph)]
+        chapters = [("Chapter 1", LONG_PARAGRAPH)]
         chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=1000)
 
         assert len(chunks) == 2
         assert all(len(chunk.text) <= 1000 for chunk in chunks)
-        assert "".join(chunk.text for chunk in chunks) == long_paragraph
+        assert "".join(chunk.text for chunk in chunks) == LONG_PARAGRAPH
+
+    def test_paragraphs_packed_up_to_limit(self):
+        """Paragraphs should be joined with single spaces until the limit is reached."""
+        chapters = [("Chapter 1", "aaaa\nbbbb\ncccc\ndddd")]
+        chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=14)
+
+        assert [chunk.text for chunk in chunks] == ["aaaa bbbb cccc", "dddd"]
+
+    def test_hard_split_pieces_are_trimmed(self):
+        """Hard-split pieces of an overlong sentence should not carry edge whitespace."""
+        chapters = [("Chapter 1", "abcd efgh ijkl")]
+        chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=5)
+
+        assert [chunk.text for chunk in chunks] == ["abcd", "efgh", "ijkl"]
 
     def test_empty_input(self):
         """Empty input should return empty chunks and chapter_starts."""
@@ -92,26 +108,95 @@ class TestSplitTextToChunks:
     def test_preserves_chapter_title_for_all_chunks(self):
         """All chunks from same chapter should have same title."""
         # Create content that will split into multiple chunks
-        paragraphs = ["Para " + str(i) + " " + "x" * 50 for i in range(20)]
-        chapters = [("Test Chapter", "\n\n".join(paragraphs))]
+        chapters = [("Test Chapter", MANY_PARAGRAPHS)]
         chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=100)
 
         for chunk in chunks:
             assert chunk.chapter_title == "Test Chapter"
 
+    def test_compiled_split_pattern_matches_string(self):
+        """A precompiled split pattern should chunk exactly like its source string."""
+        chapters = [("Ch", "One.\n\nTwo.\nThree."), ("Ch2", "Four.")]
+
+        from_string = split_text_to_chunks(chapters, chunk_chars=6, split_pattern=r"\n+")
+        from_compiled = split_text_to_chunks(
+            chapters, chunk_chars=6, split_pattern=re.compile(r"\n+")
+        )
+
+        assert from_compiled == from_string
+        assert [chunk.text for chunk in from_string[0]] == ["One.", "Two.", "Three.", "Four."]
+
+    @pytest.mark.parametrize("pattern", [r"\n+", "\n\n", "--", r"\n\s*\n", re.compile("x", re.I)])
+    def test_split_fast_path_matches_regex(self, pattern):
+        """str.split fast paths should produce the same paragraphs as re.split."""
+        text = "A--b\n\n\nC x D X e\n \nF\nG"
+
+        pieces = [p.strip() for p in _paragraph_splitter(pattern)(text) if p.strip()]
+
+        assert pieces == [p.strip() for p in re.split(pattern, text) if p.strip()]
+
+    def test_oversized_paragraph_packs_sentences(self):
+        """Sentences of an oversized paragraph should be packed greedily up to the limit."""
+        paragraph = "One two. Three four. Five six seven. Eight."
+        chunks, _ = split_text_to_chunks([("Ch", paragraph)], chunk_chars=20)
+
+        assert [chunk.text for chunk in chunks] == [
+            "One two. Three four.",
+            "Five six seven.",
+            "Eight.",
+        ]
+
+    @pytest.mark.parametrize("chunk_chars", [5, 9, 12, 20, 40])
+    def test_split_oversize_matches_greedy_packing(self, chunk_chars):
+        """Bisected sentence packing should match a greedy fill up to chunk_chars."""
+        sentences = ["One.", "Two two.", "Three three.", "Four.", "Five five five.", "Six."]
+        paragraph = " ".join(sentences) + " " + "x" * (chunk_chars + 3)
+
+        expected, buffer = [], ""
+        for sentence in sentences:
+            if len(sentence) > chunk_chars:
+                if buffer:
+                    expected.append(buffer)
+                    buffer = ""
+                expected.extend(
+                    sentence[i:i + chunk_chars].strip() for i in range(0, len(sentence), chunk_chars)
+                )
+            elif buffer and len(buffer) + 1 + len(sentence) <= chunk_chars:
+                buffer = f"{buffer} {sentence}"
+            else:
+                if buffer:
+                    expected.append(buffer)
+                buffer = sentence
+        if buffer:
+            expected.append(buffer)
+        tail = "x" * (chunk_chars + 3)
+        expected.extend(tail[i:i + chunk_chars] for i in range(0, len(tail), chunk_chars))
+
+        assert _split_oversize(paragraph, chunk_chars) == expected
+
     def test_return_type(self):
         """Return type should be tuple of (list of TextChunk, list of chapter starts)."""
         chapters = [("Ch1", "Text")]
         result = split_text_to_chunks(chapters, chunk_chars=1200)
 
         assert isinstance(result, tuple)
+        assert isinstance(result, SplitResult)
         assert len(result) == 2
+        assert result.chunks is result[0]
+        assert result.chapter_starts == [(0, "Ch1")]
 
         chunks, chapter_starts = result
         assert isinstance(chunks, list)
-        assert all(isinstance(c, TextChunk) for c in chunks)
+        assert {type(c) for c in chunks} <= {TextChunk}
         assert isinstance(chapter_starts, list)
 
+    def test_chunks_cache_text_length(self):
+        """Each chunk should carry its text length without affecting equality."""
+        chunks, _ = split_text_to_chunks([("Ch", "First para.\nSecond para.")], chunk_chars=1200)
+
+        assert [chunk.nchars for chunk in chunks] == [len(chunk.text) for chunk in chunks]
+        assert chunks[0] == TextChunk("Ch", "First para. Second para.")
+
     def test_whitespace_normalization(self):
         """Whitespace in paragraphs should be normalized."""
         chapters = [("Chapter 1", "Para 1\n\n\n\n\nPara 2")]
@@ -122,32 +207,34 @@ class TestSplitTextToChunks:
         assert "Para 1" in chunks[0].text
         assert "Para 2" in chunks[0].text
 
+    def test_whitespace_only_paragraphs_dropped(self):
+        """Whitespace-only paragraphs should vanish and real ones should be trimmed."""
+        chapters = [("Chapter 1", "  Para 1 \n \t \n\n\u3000\n Para 2\t")]
+        chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=1200)
 
-@pytest.mark.unit
-class TestChapterStartIndices:
-    """Test cases for chapter_start_indices returned by split_text_to_chunks."""
+        assert [chunk.text for chunk in chunks] == ["Para 1 Para 2"]
 
-    def test_single_chapter_start_index(self):
-        """Single chapter should have start index of 0."""
-        chapters = [("Chapter 1", "Some text content.")]
-        chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=1200)
 
-        assert len(chapter_starts) == 1
-        assert chapter_starts[0] == (0, "Chapter 1")
+class TestChapterStartIndices:
+    """Test cases for chapter_start_indices returned by split_text_to_chunks."""
 
-    def test_multiple_chapter_start_indices(self):
-        """Each chapter should have correct start index."""
-        chapters = [
-            ("Chapter 1", "First chapter."),
-            ("Chapter 2", "Second chapter."),
-            ("Chapter 3", "Third chapter."),
-        ]
+    @pytest.mark.parametrize(
+        "chapters",
+        [
+            [("Chapter 1", "Some text content.")],
+            [
+                ("Chapter 1", "First chapter."),
+                ("Chapter 2", "Second chapter."),
+                ("Chapter 3", "Third chapter."),
+            ],
+        ],
+        ids=["single", "multiple"],
+    )
+    def test_chapter_start_indices(self, chapters):
+        """Each short chapter should start at its own chunk index."""
         chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=1200)
 
-        assert len(chapter_starts) == 3
-        assert chapter_starts[0] == (0, "Chapter 1")
-        assert chapter_starts[1] == (1, "Chapter 2")
-        assert chapter_starts[2] == (2, "Chapter 3")
+        assert chapter_starts == [(i, title) for i, (title, _) in enumerate(chapters)]
 
     def test_chapter_with_multiple_chunks_start_index(self):
         """Chapter split into multiple chunks should still have single start."""
@@ -160,6 +247,15 @@ class TestChapterStartIndices:
         assert len(chapter_starts) == 1
         assert chapter_starts[0] == (0, "Long Chapter")
 
+    def test_start_indices_follow_multi_chunk_chapters(self):
+        """Later chapters should start after every chunk of the earlier ones."""
+        chapters = [("Long", MANY_PARAGRAPHS), ("Empty", ""), ("Short", "Tail."), ("Long 2", MANY_PARAGRAPHS)]
+        chunks, chapter_starts = split_text_to_chunks(chapters, chunk_chars=100)
+
+        per_chapter = len(split_text_to_chunks([("Long", MANY_PARAGRAPHS)], chunk_chars=100).chunks)
+        assert chapter_starts == [(0, "Long"), (per_chapter, "Short"), (per_chapter + 1, "Long 2")]
+        assert len(chunks) == 2 * per_chapter + 1
+
     def test_empty_chapters_not_in_start_indices(self):
         """Empty chapters should not appear in start indices."""
         chapters = [
@@ -0,0 +1,89 @@
+"""Tests for repeated-chunk synthesis caching in the sequential pipeline."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app import TextChunk
+from audiobook_backend.pipeline import SynthesisCache, run_sequential_pipeline
+
+
+def run_pipeline(chunks, backend, spool_path, synthesis_cache=None):
+    return run_sequential_pipeline(
+        chunks=chunks,
+        backend=backend,
+        voice="af_heart",
+        speed=1.0,
+        split_pattern=r"\n+",
+        events=MagicMock(),
+        progress=None,
+        task_id=None,
+        use_mp3_stream=False,
+        mp3_export_proc=None,
+        spool_path=spool_path,
+        use_checkpoint=False,
+        resume=False,
+        checkpoint_dir="unused",
+        completed_chunks=set(),
+        checkpoint_state=None,
+        synthesis_cache=synthesis_cache,
+    )
+
+
+@pytest.mark.unit
+class TestSynthesisCache:
+    """Test cases for SynthesisCache and its use in run_sequential_pipeline."""
+
+    def test_repeated_chunk_is_synthesized_once(self, temp_dir):
+        """Identical chunk text should reuse cached PCM instead of re-running TTS."""
+        backend = SimpleNamespace(
+            generate=MagicMock(
+                side_effect=lambda **kwargs: [
+                    np.array([0.5, -0.5], dtype=np.float32),
+                    np.array([0.25], dtype=np.float32),
+                ]
+            )
+        )
+        chunks = [
+            TextChunk("Ch", "* * *"),
+            TextChunk("Ch", "Body text."),
+            TextChunk("Ch", "* * *"),
+        ]
+        spool_path = f"{temp_dir}/spool.pcm"
+
+        result = run_pipeline(chunks, backend, spool_path)
+
+        assert backend.generate.call_count == 2
+        pcm = np.fromfile(spool_path, dtype=np.int16)
+        expected_chunk = [16383, -16383, 8191]
+        np.testing.assert_array_equal(pcm, expected_chunk * 3)
+        assert result.chunk_sample_offsets == [0, 3, 6]
+        assert result.total_samples == 9
+
+    def test_long_chunks_are_not_cached(self, temp_dir):
+        """Chunks longer than max_text_chars should always be synthesized."""
+        backend = SimpleNamespace(
+            generate=MagicMock(side_effect=lambda **kwargs: [np.zeros(2, dtype=np.int16)])
+        )
+        cache = SynthesisCache(max_text_chars=4)
+        chunks = [TextChunk("Ch", "long text"), TextChunk("Ch", "long text")]
+
+        run_pipeline(chunks, backend, f"{temp_dir}/spool.pcm", synthesis_cache=cache)
+
+        assert backend.generate.call_count == 2
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Cache should evict the least recently used key when full."""
+        cache = SynthesisCache(max_entries=2)
+        cache.put(("a",), (b"a",))
+        cache.put(("b",), (b"b",))
+        assert cache.get(("a",)) == (b"a",)
+
+        cache.put(("c",), (b"c",))
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == (b"a",)
+        assert cache.get(("c",)) == (b"c",)